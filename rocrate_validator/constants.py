@@ -56,6 +56,14 @@ PROFILE_FILE_EXTENSIONS = [".ttl", ".py"]
 # Define the default ontology file name
 DEFAULT_ONTOLOGY_FILE = "ontology.ttl"
 
+# Define the path of the JSON-LD contexts shipped with the package
+DEFAULT_JSONLD_CONTEXTS_PATH = "contexts"
+
+# Define the map of the well-known JSON-LD contexts to the corresponding local files
+JSONLD_CONTEXT_FILES = {
+    "https://w3id.org/ro/crate/1.1/context": "ro-crate-1.1.jsonld"
+}
+
 # Define allowed RDF extensions and serialization formats as map
 RDF_SERIALIZATION_FILE_FORMAT_MAP = {
     "xml": "xml",
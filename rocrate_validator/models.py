@@ -16,13 +16,16 @@ from __future__ import annotations
 
 import bisect
 import enum
-import inspect
+import importlib
 import json
+import os
 import re
+import sys
 from abc import ABC, abstractmethod
 from collections.abc import Collection
 from dataclasses import asdict, dataclass
-from functools import total_ordering
+from functools import lru_cache, total_ordering
+from itertools import compress
 from pathlib import Path
 from typing import Optional, Tuple, Union
 
@@ -45,19 +48,43 @@ from rocrate_validator.errors import (DuplicateRequirementCheck,
                                       ProfileSpecificationNotFound,
                                       ROCrateMetadataNotFoundError)
 from rocrate_validator.events import Event, EventType, Publisher
-from rocrate_validator.rocrate import ROCrate
+from rocrate_validator.rocrate import ROCrate, __close_http_session__
 from rocrate_validator.utils import (URI, MapIndex, MultiIndexMap,
                                      get_profiles_path,
-                                     get_requirement_name_from_file)
+                                     get_requirement_name_from_file,
+                                     resolve_jsonld_context)
 
 # set the default profiles path
 DEFAULT_PROFILES_PATH = get_profiles_path()
 
 logger = logging.getLogger(__name__)
 
+# sets of the allowed profile file extensions and of the ignored directory names
+_PROFILE_FILE_EXTENSIONS = frozenset(PROFILE_FILE_EXTENSIONS)
+_IGNORED_PROFILE_DIRECTORIES = frozenset(IGNORED_PROFILE_DIRECTORIES)
+
+# map of the requirement file extensions to the corresponding requirement types
+_REQUIREMENT_TYPES_BY_EXTENSION = {".py": "python", ".ttl": "shacl"}
+
+# Relative path of the RO-Crate metadata file
+_ROCRATE_METADATA_FILE_PATH = Path(ROCRATE_METADATA_FILE)
+
 BaseTypes = Union[str, Path, bool, int, None]
 
 
+@lru_cache(maxsize=128)
+def _read_profile_readme(readme_file_path: Path) -> Optional[str]:
+    """
+    Read the README file of a profile, shared by all the profile instances
+    loaded from the same directory. Return None if the file does not exist.
+    """
+    try:
+        with open(readme_file_path, "r") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
 @enum.unique
 @enum_tools.documentation.document_enum
 @total_ordering
@@ -85,7 +112,6 @@ class Severity(enum.Enum):
 
 
 @total_ordering
-@dataclass
 class RequirementLevel:
 
     """
@@ -94,10 +120,34 @@ class RequirementLevel:
     A requirement has a name and a severity level of type :class:`.Severity`.
     It implements the comparison operators to allow ordering of the requirement levels.
     """
-    name: str
-    severity: Severity
+
+    # requirement levels are immutable constants used as dict/set keys:
+    # no per-instance dict and the hash is computed only once
+    __slots__ = ('name', 'severity', '_hash')
+
+    # map of the instances created so far: (name, severity) -> RequirementLevel;
+    # equal requirement levels are always the same instance
+    __instances__: dict[tuple[str, Severity], RequirementLevel] = {}
+
+    def __new__(cls, name: str, severity: Severity) -> RequirementLevel:
+        instance = cls.__instances__.get((name, severity))
+        if instance is None:
+            instance = super().__new__(cls)
+            cls.__instances__[(name, severity)] = instance
+        return instance
+
+    def __init__(self, name: str, severity: Severity):
+        self.name = name
+        self.severity = severity
+        self._hash = hash((name, severity))
+
+    def __reduce__(self):
+        # copies and unpickled instances resolve to the interned instance
+        return (RequirementLevel, (self.name, self.severity))
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, RequirementLevel):
             return False
         return self.name == other.name and self.severity == other.severity
@@ -109,10 +159,11 @@ class RequirementLevel:
         #       and also a != b and not a > b, which is incoherent with a >= b
         if not isinstance(other, RequirementLevel):
             raise TypeError(f"Cannot compare {type(self)} with {type(other)}")
-        return self.severity < other.severity
+        # compare the plain severity values, skipping the Severity.__lt__ dispatch
+        return self.severity.value < other.severity.value
 
     def __hash__(self) -> int:
-        return hash((self.name, self.severity))
+        return self._hash
 
     def __repr__(self) -> str:
         return f'RequirementLevel(name={self.name}, severity={self.severity})'
@@ -169,18 +220,23 @@ class LevelCollection:
 
     @staticmethod
     def all() -> list[RequirementLevel]:
-        return [level for name, level in inspect.getmembers(LevelCollection)
-                if not inspect.isroutine(level)
-                and not inspect.isdatadescriptor(level) and not name.startswith('__')]
+        return LevelCollection.__levels__.copy()
 
     @staticmethod
     def get(name: str) -> RequirementLevel:
         try:
-            return getattr(LevelCollection, name.upper())
-        except AttributeError:
+            return LevelCollection.__levels_by_name__[name.upper()]
+        except KeyError:
             raise ValueError(f"Invalid RequirementLevel: {name}")
 
 
+# the lookup tables of the requirement levels are built once, when the module is loaded
+LevelCollection.__levels__ = sorted((level for level in vars(LevelCollection).values()
+                                     if isinstance(level, RequirementLevel)),
+                                    key=lambda level: level.name)
+LevelCollection.__levels_by_name__ = {level.name: level for level in LevelCollection.__levels__}
+
+
 @total_ordering
 class Profile:
 
@@ -234,6 +290,14 @@ class Profile:
         self._name: Optional[str] = None
         self._description: Optional[str] = None
         self._requirements: list[Requirement] = requirements if requirements is not None else []
+        self._requirements_loaded = False
+        # cache of the requirements filtered by severity: (severity, exact_match) -> requirements
+        self._requirements_by_severity: dict[tuple[Severity, bool], list[Requirement]] = {}
+        # indexes of the requirements (by name and type) and of the requirement checks by name,
+        # built on first lookup
+        self._requirements_by_name: Optional[dict[str, Requirement]] = None
+        self._requirements_by_type: dict[type, list[Requirement]] = {}
+        self._checks_by_name: Optional[dict[str, RequirementCheck]] = None
         self._publicID = publicID
         self._severity = severity
 
@@ -243,6 +307,10 @@ class Profile:
         # init property to store the RDF graph of the profile specification
         self._profile_specification_graph = None
 
+        # init properties to cache the inheritance declared in the profile specification
+        self._is_profile_of: Optional[list[str]] = None
+        self._is_transitive_profile_of: Optional[list[str]] = None
+
         # check if the profile specification file exists
         spec_file = self.profile_specification_file_path
         if not spec_file or not spec_file.exists():
@@ -352,7 +420,9 @@ class Profile:
         as specified in the profile specification file
         (i.e., the value of the prof: isProfileOf property in the `profile.ttl` file).
         """
-        return self.__get_specification_property__("isProfileOf", PROF_NS, pop_first=False)
+        if self._is_profile_of is None:
+            self._is_profile_of = self.__get_specification_property__("isProfileOf", PROF_NS, pop_first=False)
+        return self._is_profile_of.copy()
 
     @property
     def is_transitive_profile_of(self) -> list[str]:
@@ -361,7 +431,10 @@ class Profile:
         as specified in the profile specification file
         (i.e., the value of the prof: isTransitiveProfileOf property in the `profile.ttl` file).
         """
-        return self.__get_specification_property__("isTransitiveProfileOf", PROF_NS, pop_first=False)
+        if self._is_transitive_profile_of is None:
+            self._is_transitive_profile_of = self.__get_specification_property__(
+                "isTransitiveProfileOf", PROF_NS, pop_first=False)
+        return self._is_transitive_profile_of.copy()
 
     @property
     def parents(self) -> list[Profile]:
@@ -417,11 +490,8 @@ class Profile:
         (i.e., the value of the rdfs: comment property in the `profile.ttl` file).
         """
         if not self._description:
-            if self.path and self.readme_file_path.exists():
-                with open(self.readme_file_path, "r") as f:
-                    self._description = f.read()
-            else:
-                self._description = self.comment
+            readme = _read_profile_readme(self.readme_file_path) if self.path else None
+            self._description = readme if readme is not None else self.comment
         return self._description
 
     @property
@@ -429,9 +499,13 @@ class Profile:
         """
         The list of requirements of the profile.
         """
-        if not self._requirements:
-            self._requirements = \
-                RequirementLoader.load_requirements(self, severity=self.severity)
+        if not self._requirements_loaded:
+            # load the requirements only once, even if the profile has none
+            if not self._requirements:
+                self._requirements = \
+                    RequirementLoader.load_requirements(self, severity=self.severity)
+                self.__clear_requirements_cache__()
+            self._requirements_loaded = True
         return self._requirements
 
     def get_requirements(
@@ -443,39 +517,59 @@ class Profile:
         are returned; otherwise, the requirements with severity level greater than or equal to
         the given severity level are returned.
         """
-        return [requirement for requirement in self.requirements
-                if (not exact_match and
-                    (not requirement.severity_from_path or requirement.severity_from_path >= severity)) or
-                (exact_match and requirement.severity_from_path == severity)]
+        key = (severity, exact_match)
+        requirements = self._requirements_by_severity.get(key)
+        if requirements is None:
+            if exact_match:
+                requirements = [r for r in self.requirements if r.severity_from_path == severity]
+            else:
+                requirements = [r for r in self.requirements
+                                if not r.severity_from_path or r.severity_from_path >= severity]
+            self._requirements_by_severity[key] = requirements
+        return requirements.copy()
 
     def get_requirement(self, name: str) -> Optional[Requirement]:
         """
         Get the requirement with the given name
         """
-        for requirement in self.requirements:
-            if requirement.name == name:
-                return requirement
-        return None
+        if self._requirements_by_name is None:
+            requirements_by_name = {}
+            for requirement in self.requirements:
+                requirements_by_name.setdefault(requirement.name, requirement)
+            self._requirements_by_name = requirements_by_name
+        return self._requirements_by_name.get(name)
+
+    def get_requirements_by_type(self, requirement_type: type[Requirement]) -> list[Requirement]:
+        """
+        Get the requirements of the profile which are instances of the given requirement type
+        """
+        requirements = self._requirements_by_type.get(requirement_type)
+        if requirements is None:
+            requirements = [r for r in self.requirements if isinstance(r, requirement_type)]
+            self._requirements_by_type[requirement_type] = requirements
+        return requirements.copy()
 
     def get_requirement_check(self, check_name: str) -> Optional[RequirementCheck]:
         """
         Get the requirement check with the given name
         """
-        for requirement in self.requirements:
-            check = requirement.get_check(check_name)
-            if check:
-                return check
-        return None
+        if self._checks_by_name is None:
+            checks_by_name = {}
+            for requirement in self.requirements:
+                for check in requirement.get_checks():
+                    checks_by_name.setdefault(check.name, check)
+            self._checks_by_name = checks_by_name
+        return self._checks_by_name.get(check_name)
 
     @classmethod
     def __get_nested_profiles__(cls, source: str) -> list[str]:
         result = []
-        visited = []
+        visited = set()
         queue = [source]
         while len(queue) > 0:
             p = queue.pop()
             if p not in visited:
-                visited.append(p)
+                visited.add(p)
                 profile = cls.__profiles_map.get_by_key(p)
                 inherited_profiles = profile.is_profile_of
                 if inherited_profiles:
@@ -496,9 +590,17 @@ class Profile:
 
     def add_requirement(self, requirement: Requirement):
         self._requirements.append(requirement)
+        self.__clear_requirements_cache__()
 
     def remove_requirement(self, requirement: Requirement):
         self._requirements.remove(requirement)
+        self.__clear_requirements_cache__()
+
+    def __clear_requirements_cache__(self):
+        self._requirements_by_severity.clear()
+        self._requirements_by_name = None
+        self._requirements_by_type.clear()
+        self._checks_by_name = None
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, Profile) \
@@ -620,13 +722,16 @@ class Profile:
         profiles = []
         # calculate the list of profiles path as the subdirectories of the profiles path
         # where the profile specification file is present
-        profile_paths = [p.parent for p in profiles_path.rglob('*.*') if p.name == PROFILE_SPECIFICATION_FILE]
+        profile_paths = []
+        for dir_path, dir_names, file_names in os.walk(profiles_path):
+            dir_names[:] = [_ for _ in dir_names if _ not in _IGNORED_PROFILE_DIRECTORIES]
+            if PROFILE_SPECIFICATION_FILE in file_names:
+                profile_paths.append(Path(dir_path))
 
         # iterate through the directories and load the profiles
         for profile_path in profile_paths:
-            logger.debug("Checking profile path: %s %s %r", profile_path,
-                         profile_path.is_dir(), IGNORED_PROFILE_DIRECTORIES)
-            if profile_path.is_dir() and profile_path not in IGNORED_PROFILE_DIRECTORIES:
+            logger.debug("Checking profile path: %s %r", profile_path, IGNORED_PROFILE_DIRECTORIES)
+            if profile_path.name not in _IGNORED_PROFILE_DIRECTORIES:
                 profile = Profile.load(profiles_path, profile_path, publicID=publicID, severity=severity)
                 profiles.append(profile)
 
@@ -768,9 +873,9 @@ class Requirement(ABC):
         self._overridden = None
 
         if not name and path:
-            self._name = get_requirement_name_from_file(path)
-        else:
-            self._name = name
+            name = get_requirement_name_from_file(path)
+        # names are used as lookup keys: intern them
+        self._name = sys.intern(str(name)) if name else name
 
         # set flag to indicate if the checks have been initialized
         self._checks_initialized = False
@@ -877,8 +982,8 @@ class Requirement(ABC):
         return list({check for check in self._checks if check.level.severity == level.severity})
 
     def __reorder_checks__(self) -> None:
-        for i, check in enumerate(self._checks):
-            check.order_number = i + 1
+        for i, check in enumerate(self._checks, start=1):
+            check._order_number = i
 
     def _do_validate_(self, context: ValidationContext) -> bool:
         """
@@ -891,31 +996,38 @@ class Requirement(ABC):
 
         logger.debug("Running %s checks for Requirement '%s'", len(self._checks), self.name)
         all_passed = True
+        validator = context.validator
+        result = context.result
+        fail_fast = context.fail_fast
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         for check in self._checks:
             try:
-                logger.debug("Running check '%s' - Desc: %s - overridden: %s",
-                             check.name, check.description, [_.identifier for _ in check.overridden_by])
-                if check.overridden:
+                # resolve the overriding checks only once: it requires a lookup on every sibling profile
+                overridden_by = check.overridden_by
+                if debug_enabled:
+                    logger.debug("Running check '%s' - Desc: %s - overridden: %s",
+                                 check.name, check.description, [_.identifier for _ in overridden_by])
+                if overridden_by:
                     logger.debug("Skipping check '%s' because overridden by '%r'",
-                                 check.identifier, [_.identifier for _ in check.overridden_by])
+                                 check.identifier, [_.identifier for _ in overridden_by])
                     continue
-                context.validator.notify(RequirementCheckValidationEvent(
+                validator.notify(RequirementCheckValidationEvent(
                     EventType.REQUIREMENT_CHECK_VALIDATION_START, check))
                 check_result = check.execute_check(context)
                 logger.debug("Result of check %s: %s", check.identifier, check_result)
-                context.result._add_executed_check(check, check_result)
-                context.validator.notify(RequirementCheckValidationEvent(
+                result._add_executed_check(check, check_result)
+                validator.notify(RequirementCheckValidationEvent(
                     EventType.REQUIREMENT_CHECK_VALIDATION_END, check, validation_result=check_result))
                 logger.debug("Ran check '%s'. Got result %s", check.name, check_result)
                 if not isinstance(check_result, bool):
                     logger.warning("Ignoring the check %s as it returned the value %r instead of a boolean", check.name)
                     raise RuntimeError(f"Ignoring invalid result from check {check.name}")
                 all_passed = all_passed and check_result
-                if not all_passed and context.fail_fast:
+                if not all_passed and fail_fast:
                     break
             except SkipRequirementCheck as e:
                 logger.debug("Skipping check '%s' because: %s", check.name, e)
-                context.result._add_skipped_check(check)
+                result._add_skipped_check(check)
                 continue
             except Exception as e:
                 # Ignore the fact that the check failed as far as the validation result is concerned.
@@ -982,18 +1094,15 @@ class RequirementLoader:
         return self._profile
 
     @staticmethod
-    def __get_requirement_type__(requirement_path: Path) -> str:
-        if requirement_path.suffix == ".py":
-            return "python"
-        elif requirement_path.suffix == ".ttl":
-            return "shacl"
-        else:
-            raise ValueError(f"Unsupported requirement type: {requirement_path.suffix}")
+    def __get_requirement_type__(file_name: str) -> str:
+        suffix = os.path.splitext(file_name)[1]
+        try:
+            return _REQUIREMENT_TYPES_BY_EXTENSION[suffix]
+        except KeyError:
+            raise ValueError(f"Unsupported requirement type: {suffix}")
 
     @classmethod
-    def __get_requirement_loader__(cls, profile: Profile, requirement_path: Path) -> RequirementLoader:
-        import importlib
-        requirement_type = cls.__get_requirement_type__(requirement_path)
+    def __get_requirement_loader__(cls, profile: Profile, requirement_type: str) -> RequirementLoader:
         loader_instance_name = f"_{requirement_type}_loader_instance"
         loader_instance = getattr(profile, loader_instance_name, None)
         if loader_instance is None:
@@ -1011,33 +1120,58 @@ class RequirementLoader:
         """
         Load the requirements related to the profile
         """
-        def ok_file(p: Path) -> bool:
-            return p.is_file() \
-                and p.suffix in PROFILE_FILE_EXTENSIONS \
-                and not p.name == DEFAULT_ONTOLOGY_FILE \
-                and not p.name == PROFILE_SPECIFICATION_FILE \
-                and not p.name.startswith('.') \
-                and not p.name.startswith('_')
-
-        files = sorted((p for p in profile.path.rglob('*.*') if ok_file(p)),
-                       key=lambda x: (not x.suffix == '.py', x))
+        def requirement_type_of(name: str) -> Optional[str]:
+            # return the type of the requirements defined in the file
+            # or None if the file is not a requirement file
+            if name[:1] in ('.', '_') or name == DEFAULT_ONTOLOGY_FILE or name == PROFILE_SPECIFICATION_FILE:
+                return None
+            extension = name[name.rfind('.'):]
+            if extension not in _PROFILE_FILE_EXTENSIONS:
+                return None
+            return _REQUIREMENT_TYPES_BY_EXTENSION.get(extension)
 
         # set the requirement level corresponding to the severity
         requirement_level = LevelCollection.get(severity.name)
 
-        requirements = []
-        for requirement_path in files:
+        # collect the requirement files with a single scan of the profile directory,
+        # grouped by requirement type (Python requirements are loaded first)
+        files_by_type: dict[str, list[Path]] = {"python": [], "shacl": []}
+
+        def scan(dir_path: str):
+            # the requirement level is determined once per directory:
+            # skip the files of the directory if its level is lower than the requested one
+            skip_files = False
             try:
-                requirement_level_from_path = LevelCollection.get(requirement_path.parent.name)
-                if requirement_level_from_path < requirement_level:
-                    continue
+                requirement_level_from_path = LevelCollection.get(os.path.basename(dir_path))
+                skip_files = requirement_level_from_path < requirement_level
             except ValueError:
-                logger.debug("The requirement level could not be determined from the path: %s", requirement_path)
-            requirement_loader = RequirementLoader.__get_requirement_loader__(profile, requirement_path)
-            for requirement in requirement_loader.load(
-                    profile, requirement_level,
-                    requirement_path, publicID=profile.publicID):
-                requirements.append(requirement)
+                logger.debug("The requirement level could not be determined from the path: %s", dir_path)
+            sub_dirs = []
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # do not descend into hidden directories (e.g., VCS or editor metadata)
+                        if entry.name[:1] != '.' and entry.name not in _IGNORED_PROFILE_DIRECTORIES:
+                            sub_dirs.append(entry.path)
+                    elif not skip_files:
+                        requirement_type = requirement_type_of(entry.name)
+                        if requirement_type is not None and entry.is_file():
+                            files_by_type[requirement_type].append(Path(entry.path))
+            for sub_dir in sub_dirs:
+                scan(sub_dir)
+
+        scan(os.fspath(profile.path))
+
+        requirements = []
+        for requirement_type, files in files_by_type.items():
+            if not files:
+                continue
+            requirement_loader = RequirementLoader.__get_requirement_loader__(profile, requirement_type)
+            for requirement_path in sorted(files):
+                for requirement in requirement_loader.load(
+                        profile, requirement_level,
+                        requirement_path, publicID=profile.publicID):
+                    requirements.append(requirement)
         # sort the requirements by severity
         requirements = sorted(requirements,
                               key=lambda x: (-x.severity_from_path.value, x.path.name, x.name)
@@ -1063,7 +1197,7 @@ class RequirementCheck(ABC):
                  hidden: Optional[bool] = None):
         self._requirement: Requirement = requirement
         self._order_number = 0
-        self._name = name
+        self._name = sys.intern(str(name)) if name else name
         self._level = level
         self._description = description
         self._hidden = hidden
@@ -1095,7 +1229,7 @@ class RequirementCheck(ABC):
     @property
     def description(self) -> str:
         if not self._description:
-            return self.__class__.__doc__.strip() if self.__class__.__doc__ else f"Check {self.name}"
+            self._description = self.__class__.__doc__.strip() if self.__class__.__doc__ else f"Check {self.name}"
         return self._description
 
     @property
@@ -1181,6 +1315,11 @@ class CheckIssue:
     during the validation process.
     """
 
+    # issues are created for every violation found:
+    # slots keep the per-instance footprint small
+    __slots__ = ('_message', '_check', '_violatingProperty', '_violatingEntity', '_propertyValue',
+                 '_severity_value', '_hash')
+
     def __init__(self,
                  check: RequirementCheck,
                  message: Optional[str] = None,
@@ -1192,6 +1331,10 @@ class CheckIssue:
         self._violatingProperty = violatingProperty
         self._violatingEntity = violatingEntity
         self._propertyValue = value
+        # integer value of the severity, used to filter issues with plain int comparisons
+        self._severity_value: int = check.severity.value
+        # check and message never change: compute the hash once, when the issue is created
+        self._hash: int = hash((check, message))
 
     @property
     def message(self) -> Optional[str]:
@@ -1261,7 +1404,7 @@ class CheckIssue:
         return (self._check, self._message) < (other._check, other._message)
 
     def __hash__(self) -> int:
-        return hash((self._check, self._message))
+        return self._hash
 
     def __repr__(self) -> str:
         return f'CheckIssue(severity={self.severity}, check={self.check}, message={self.message})'
@@ -1315,8 +1458,22 @@ class ValidationResult:
         self._rocrate_uri = context.rocrate_uri
         # reference to the validation settings
         self._validation_settings: ValidationSettings = context.settings
+        # value of the requirement severity used by default to filter the issues
+        self._default_severity_value: int = context.requirement_severity.value
         # keep track of the issues found during the validation
         self._issues: list[CheckIssue] = []
+        # severity values of the issues, kept aligned with the list of issues
+        self._issues_severity_values: list[int] = []
+        # highest severity value of the issues (-1 while there are no issues)
+        self._max_severity_value: int = -1
+        # map of the issues added so far by their content (to the first issue added with it),
+        # used by the SHACL checks to skip the violations already reported
+        self._issues_by_content: dict[tuple, CheckIssue] = {}
+        # keep track of the failed checks and requirements,
+        # updated incrementally as issues are added
+        self._failed_checks: set[RequirementCheck] = set()
+        self._failed_requirements: set[Requirement] = set()
+        self._failed_checks_by_requirement: dict[Requirement, set[RequirementCheck]] = {}
         # keep track of the checks that have been executed
         self._executed_checks: set[RequirementCheck] = set()
         self._executed_checks_results: dict[str, bool] = {}
@@ -1400,8 +1557,8 @@ class ValidationResult:
         """
         Get the issues found during the validation with a severity greater than or equal to `min_severity`
         """
-        min_severity = min_severity or self.context.requirement_severity
-        return [issue for issue in self._issues if issue.severity >= min_severity]
+        threshold = min_severity.value if min_severity else self._default_severity_value
+        return list(compress(self._issues, [value >= threshold for value in self._issues_severity_values]))
 
     def get_issues_by_check(self,
                             check: RequirementCheck,
@@ -1410,8 +1567,34 @@ class ValidationResult:
         Get the issues found during the validation for a specific check
         with a severity greater than or equal to `min_severity`
         """
-        min_severity = min_severity or self.context.requirement_severity
-        return [issue for issue in self._issues if issue.check == check and issue.severity >= min_severity]
+        threshold = min_severity.value if min_severity else self._default_severity_value
+        return [issue for issue, value in zip(self._issues, self._issues_severity_values)
+                if value >= threshold and issue._check == check]
+
+    @staticmethod
+    def __issue_key__(check: RequirementCheck,
+                      message: Optional[str],
+                      violatingEntity: Optional[str],
+                      violatingProperty: Optional[str],
+                      violatingPropertyValue: Optional[object]) -> tuple:
+        try:
+            hash(violatingPropertyValue)
+        except TypeError:
+            # unhashable values (e.g., lists, dicts or entities) are keyed by their JSON serialization
+            violatingPropertyValue = json.dumps(violatingPropertyValue, sort_keys=True, default=str)
+        return (check, message, violatingEntity, violatingProperty, violatingPropertyValue)
+
+    def get_issue(self,
+                  check: RequirementCheck,
+                  message: Optional[str],
+                  violatingEntity: Optional[str] = None,
+                  violatingProperty: Optional[str] = None,
+                  violatingPropertyValue: Optional[str] = None) -> Optional[CheckIssue]:
+        """
+        Get the first issue added with the given content, if any
+        """
+        return self._issues_by_content.get(
+            self.__issue_key__(check, message, violatingEntity, violatingProperty, violatingPropertyValue))
 
     # def get_issues_by_check_and_severity(self, check: RequirementCheck, severity: Severity) -> list[CheckIssue]:
     #     return [issue for issue in self.issues if issue.check == check and issue.severity == severity]
@@ -1420,15 +1603,14 @@ class ValidationResult:
         """
         Check if there are issues with a severity greater than or equal to the given `severity`
         """
-        min_severity = min_severity or self.context.requirement_severity
-        return any(issue.severity >= min_severity for issue in self._issues)
+        threshold = min_severity.value if min_severity else self._default_severity_value
+        return self._max_severity_value >= threshold
 
     def passed(self, min_severity: Optional[Severity] = None) -> bool:
         """
         Check if all checks passed with a severity greater than or equal to the given `severity`
         """
-        min_severity = min_severity or self.context.requirement_severity
-        return not any(issue.severity >= min_severity for issue in self._issues)
+        return not self.has_issues(min_severity)
 
     def add_issue(self,
                   message: str,
@@ -1448,7 +1630,16 @@ class ValidationResult:
         """
         c = CheckIssue(check, message, violatingProperty=violatingProperty,
                        violatingEntity=violatingEntity, value=violatingPropertyValue)
-        bisect.insort(self._issues, c)
+        self._issues_by_content.setdefault(
+            self.__issue_key__(check, message, violatingEntity, violatingProperty, violatingPropertyValue), c)
+        index = bisect.bisect_right(self._issues, c)
+        self._issues.insert(index, c)
+        self._issues_severity_values.insert(index, c._severity_value)
+        if c._severity_value > self._max_severity_value:
+            self._max_severity_value = c._severity_value
+        self._failed_checks.add(check)
+        self._failed_requirements.add(check.requirement)
+        self._failed_checks_by_requirement.setdefault(check.requirement, set()).add(check)
         return c
 
     #  --- Requirements ---
@@ -1457,7 +1648,7 @@ class ValidationResult:
         """
         Get the requirements that failed
         """
-        return set(issue.check.requirement for issue in self._issues)
+        return set(self._failed_requirements)
 
     #  --- Checks ---
     @property
@@ -1465,28 +1656,27 @@ class ValidationResult:
         """
         Get the checks that failed
         """
-        return set(issue.check for issue in self._issues)
+        return set(self._failed_checks)
 
     def get_failed_checks_by_requirement(self, requirement: Requirement) -> Collection[RequirementCheck]:
         """
         Get the checks that failed for a specific requirement
         """
-        return [check for check in self.failed_checks if check.requirement == requirement]
+        return list(self._failed_checks_by_requirement.get(requirement, ()))
 
     def get_failed_checks_by_requirement_and_severity(
             self, requirement: Requirement, severity: Severity) -> Collection[RequirementCheck]:
         """
         Get the checks that failed for a specific requirement and severity
         """
-        return [check for check in self.failed_checks
-                if check.requirement == requirement
-                and check.severity == severity]
+        return [check for check in self._failed_checks_by_requirement.get(requirement, ())
+                if check.severity == severity]
 
     def __str__(self) -> str:
-        return f"Validation result: passed={len(self.failed_checks)==0}, {len(self._issues)} issues"
+        return f"Validation result: passed={len(self._failed_checks)==0}, {len(self._issues)} issues"
 
     def __repr__(self):
-        return f"ValidationResult(passed={len(self.failed_checks)==0},issues={self._issues})"
+        return f"ValidationResult(passed={len(self._failed_checks)==0},issues={self._issues})"
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ValidationResult):
@@ -1527,7 +1717,7 @@ class ValidationResult:
 class CustomEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, CheckIssue):
-            return obj.__dict__
+            return obj.to_dict()
         if isinstance(obj, Path):
             return str(obj)
         if isinstance(obj, Severity):
@@ -1577,18 +1767,15 @@ class ValidationSettings:
     disable_check_for_duplicates: bool = False
 
     def __init__(self, **kwargs):
+        # the rocrate URI is parsed by its setter while applying the kwargs
+        self._rocrate_uri = None
         for key, value in kwargs.items():
             setattr(self, key, value)
 
         # if requirement_severity is a str, convert to Severity
-        severity = getattr(self, "requirement_severity")
+        severity = self.requirement_severity
         if isinstance(severity, str):
-            setattr(self, "requirement_severity", Severity[severity])
-
-        # parse and set the rocrate URI
-        self._rocrate_uri = None
-        if "rocrate_uri" in kwargs:
-            self.rocrate_uri = kwargs["rocrate_uri"]
+            self.requirement_severity = Severity[severity]
         logger.debug("Validating RO-Crate: %s", self.rocrate_uri)
 
     def to_dict(self):
@@ -1777,19 +1964,28 @@ class Validator(Publisher):
         """
         Validate the RO-Crate against the detected profiles according to the validation settings
         """
-        return self.__do_validate__()
+        try:
+            return self.__do_validate__()
+        finally:
+            # release the connections used to probe the remote resources
+            __close_http_session__()
 
     def validate_requirements(self, requirements: list[Requirement]) -> ValidationResult:
         """
         Validates the RO-Crate against the specified subset of the profile requirements
         """
-        assert all(isinstance(requirement, Requirement) for requirement in requirements), \
+        # the list is expected to be homogeneous: checking its first item is enough
+        assert not requirements or isinstance(requirements[0], Requirement), \
             "Invalid requirement type"
         # perform the requirements validation
-        return self.__do_validate__(requirements)
+        try:
+            return self.__do_validate__(requirements)
+        finally:
+            # release the connections used to probe the remote resources
+            __close_http_session__()
 
     def __do_validate__(self,
-                        requirements: Optional[list[Requirement]] = None) -> ValidationResult:
+                        explicit_requirements: Optional[list[Requirement]] = None) -> ValidationResult:
 
         # initialize the validation context
         context = ValidationContext(self, self.validation_settings)
@@ -1797,13 +1993,20 @@ class Validator(Publisher):
         # set the profiles to validate against
         profiles = context.profiles
         assert len(profiles) > 0, "No profiles to validate"
+        # resolve the settings used by the validation loop once
+        severity = context.requirement_severity
+        severity_only = context.requirement_severity_only
+        fail_fast = context.fail_fast
+        result = context.result
         self.notify(EventType.VALIDATION_START)
         for profile in profiles:
             logger.debug("Validating profile %s (id: %s)", profile.name, profile.identifier)
             self.notify(ProfileValidationEvent(EventType.PROFILE_VALIDATION_START, profile=profile))
             # perform the requirements validation
-            requirements = profile.get_requirements(
-                context.requirement_severity, exact_match=context.requirement_severity_only)
+            if explicit_requirements is not None:
+                requirements = [r for r in explicit_requirements if r.profile == profile]
+            else:
+                requirements = profile.get_requirements(severity, exact_match=severity_only)
             logger.debug("Validating profile %s with %s requirements", profile.identifier, len(requirements))
             logger.debug("For profile %s, validating these %s requirements: %s",
                          profile.identifier, len(requirements), requirements)
@@ -1820,18 +2023,20 @@ class Validator(Publisher):
                 if passed:
                     logger.debug("Validation Requirement passed")
                 else:
-                    logger.debug(f"Validation Requirement {requirement} failed (profile: {profile.identifier})")
-                    if context.fail_fast:
-                        logger.debug("Aborting on first requirement failure")
-                        terminate = True
-                        break
+                    logger.debug("Validation Requirement %s failed (profile: %s)", requirement, profile.identifier)
+                # a single SHACL run can report issues of the checks of the following requirements:
+                # stop as soon as the result holds an issue, without running the remaining ones
+                if fail_fast and (not passed or result.has_issues(severity)):
+                    logger.debug("Aborting on first requirement failure")
+                    terminate = True
+                    break
             self.notify(ProfileValidationEvent(EventType.PROFILE_VALIDATION_END, profile=profile))
             if terminate:
                 break
         self.notify(ValidationEvent(EventType.VALIDATION_END,
-                    validation_result=context.result))
+                    validation_result=result))
 
-        return context.result
+        return result
 
 
 class ValidationContext:
@@ -1839,7 +2044,7 @@ class ValidationContext:
     Class that represents the context for the validation process.
     """
 
-    def __init__(self, validator: Validator, settings: ValidationSettings):
+    def __init__(self, validator: Validator, settings: ValidationSettings, ro_crate: Optional[ROCrate] = None):
         # reference to the validator
         self._validator = validator
         # reference to the settings
@@ -1848,13 +2053,17 @@ class ValidationContext:
         self._data_graph = None
         # reference to the profiles
         self._profiles = None
+        # reference to the root URI of the RO-Crate
+        self._publicID: Optional[str] = None
+        # reference to the path of the profiles
+        self._profiles_path: Optional[Path] = None
         # reference to the validation result
         self._result = None
         # additional properties for the context
         self._properties = {}
 
-        # initialize the ROCrate object
-        self._rocrate = ROCrate.new_instance(settings.rocrate_uri)
+        # initialize the ROCrate object (if not shared with another context)
+        self._rocrate = ro_crate or ROCrate.new_instance(settings.rocrate_uri)
         assert isinstance(self._rocrate, ROCrate), "Invalid RO-Crate instance"
 
     @property
@@ -1904,10 +2113,12 @@ class ValidationContext:
         """
         The root URI of the RO-Crate
         """
-        path = str(self.ro_crate.uri.base_uri)
-        if not path.endswith("/"):
-            path = f"{path}/"
-        return path
+        if self._publicID is None:
+            path = str(self.ro_crate.uri.base_uri)
+            if not path.endswith("/"):
+                path = f"{path}/"
+            self._publicID = path
+        return self._publicID
 
     @property
     def profiles_path(self) -> Path:
@@ -1917,10 +2128,12 @@ class ValidationContext:
         :return: The path to the profiles
         :rtype: Path
         """
-        profiles_path = self.settings.profiles_path
-        if isinstance(profiles_path, str):
-            profiles_path = Path(profiles_path)
-        return profiles_path
+        if self._profiles_path is None:
+            profiles_path = self.settings.profiles_path
+            if isinstance(profiles_path, str):
+                profiles_path = Path(profiles_path)
+            self._profiles_path = profiles_path
+        return self._profiles_path
 
     @property
     def requirement_severity(self) -> Severity:
@@ -1975,13 +2188,24 @@ class ValidationContext:
         :return: The relative path to the file descriptor
         :rtype: Path
         """
-        return Path(ROCRATE_METADATA_FILE)
+        return _ROCRATE_METADATA_FILE_PATH
+
+    @property
+    def properties(self) -> dict:
+        """
+        Additional properties of the context,
+        e.g., intermediate results shared by the checks of a validation run
+
+        :return: The additional properties of the context
+        :rtype: dict
+        """
+        return self._properties
 
     def __load_data_graph__(self) -> Graph:
         data_graph = Graph()
         logger.debug("Loading RO-Crate metadata of: %s", self.ro_crate.uri)
-        _ = data_graph.parse(data=self.ro_crate.metadata.as_dict(),
-                             format="json-ld", publicID=self.publicID)
+        metadata = resolve_jsonld_context(self.ro_crate.metadata.as_dict(), fetch_remote=True)
+        _ = data_graph.parse(data=metadata, format="json-ld", publicID=self.publicID)
         logger.debug("RO-Crate metadata loaded: %s", data_graph)
         return data_graph
 
@@ -2000,7 +2224,9 @@ class ValidationContext:
         """
         # load the data graph
         try:
-            if not self._data_graph or refresh:
+            # the metadata is parsed into a new graph, which replaces the current one
+            # only when loaded successfully
+            if self._data_graph is None or refresh:
                 self._data_graph = self.__load_data_graph__()
             return self._data_graph
         except FileNotFoundError as e:
@@ -2115,9 +2341,13 @@ class ValidationContext:
         :return: The profiles to validate against
         :rtype: list[Profile]
         """
-        if not self._profiles:
+        return self.__get_profiles__().copy()
+
+    def __get_profiles__(self) -> list[Profile]:
+        # load the profiles only once and return the cached list (not a copy)
+        if self._profiles is None:
             self._profiles = self.__load_profiles__()
-        return self._profiles.copy()
+        return self._profiles
 
     @property
     def target_profile(self) -> Profile:
@@ -2127,9 +2357,9 @@ class ValidationContext:
         :return: The target profile
         :rtype: Profile
         """
-        profiles = self.profiles
+        profiles = self.__get_profiles__()
         assert len(profiles) > 0, "No profiles to validate"
-        return self.profiles[-1]
+        return profiles[-1]
 
     def get_profile_by_token(self, token: str) -> list[Profile]:
         """
@@ -94,37 +94,57 @@ class FileDescriptorJsonLdFormat(PyFunctionCheck):
                 logger.exception(e)
         return False
 
+    @staticmethod
+    def __is_entity_flat__(entity: Any) -> bool:
+        """ Check if the given data corresponds to a flattened JSON-LD object,
+        i.e., if every nested object is a reference to another entity.
+        The nested values are visited with an explicit stack rather than recursively.
+        """
+        stack = [(entity, True)]
+        while stack:
+            value, is_first = stack.pop()
+            if isinstance(value, dict):
+                if is_first:
+                    stack.extend((elem, False) for elem in value.values())
+                # if this is not the root element, it must contain only the @id property
+                elif len(value) != 1 or "@id" not in value:
+                    return False
+            elif isinstance(value, list):
+                stack.extend((element, False) for element in value)
+        return True
+
+    @staticmethod
+    def __scan_entities__(context: ValidationContext) -> dict[str, Any]:
+        """
+        Walk the entities of the file descriptor once and return, for each property
+        checked by this requirement, the first entity which does not satisfy it.
+        The result is shared by the checks through the validation context.
+        """
+        scan = context.properties.get("file_descriptor_entities_scan")
+        if scan is None:
+            scan = {"not_flat": None, "missing_id": None, "missing_type": None}
+            for entity in context.ro_crate.metadata.as_dict()["@graph"]:
+                if scan["not_flat"] is None and not FileDescriptorJsonLdFormat.__is_entity_flat__(entity):
+                    scan["not_flat"] = entity
+                if scan["missing_id"] is None and (not isinstance(entity, dict) or "@id" not in entity):
+                    scan["missing_id"] = entity
+                if scan["missing_type"] is None and (not isinstance(entity, dict) or "@type" not in entity):
+                    scan["missing_type"] = entity
+                if None not in scan.values():
+                    break
+            context.properties["file_descriptor_entities_scan"] = scan
+        return scan
+
     @check(name="File Descriptor JSON-LD must be flattened")
     def check_flattened(self, context: ValidationContext) -> bool:
         """ Check if the file descriptor is flattened """
-
-        def is_entity_flat_recursive(entity: Any, is_first: bool = True) -> bool:
-            """ Recursively check if the given data corresponds to a flattened JSON-LD object
-            and returns False if it does not and is not a root element
-            """
-            if isinstance(entity, dict):
-                if is_first:
-                    for _, elem in entity.items():
-                        if not is_entity_flat_recursive(elem, False):
-                            return False
-                # if this is not the root element, it must not contain more properties than @id
-                else:
-                    if "@id" not in entity or len(entity) > 1:
-                        return False
-            if isinstance(entity, list):
-                for element in entity:
-                    if not is_entity_flat_recursive(element, False):
-                        return False
-            return True
-
         try:
-            json_dict = context.ro_crate.metadata.as_dict()
-            for entity in json_dict["@graph"]:
-                if not is_entity_flat_recursive(entity):
-                    context.result.add_issue(
-                        f'RO-Crate file descriptor "{context.rel_fd_path}" '
-                        f'is not fully flattened at entity "{entity.get("@id", entity)}"', self)
-                    return False
+            entity = self.__scan_entities__(context)["not_flat"]
+            if entity is not None:
+                context.result.add_issue(
+                    f'RO-Crate file descriptor "{context.rel_fd_path}" '
+                    f'is not fully flattened at entity "{entity.get("@id", entity)}"', self)
+                return False
             return True
         except Exception as e:
             if logger.isEnabledFor(logging.DEBUG):
@@ -135,14 +155,13 @@ class FileDescriptorJsonLdFormat(PyFunctionCheck):
     def check_identifiers(self, context: ValidationContext) -> bool:
         """ Check if the file descriptor entities have the @id property """
         try:
-            json_dict = context.ro_crate.metadata.as_dict()
-            for entity in json_dict["@graph"]:
-                if "@id" not in entity:
-                    context.result.add_issue(
-                        f"Entity \"{entity.get('name', None) or entity}\" "
-                        f"of RO-Crate \"{context.rel_fd_path}\" "
-                        "file descriptor does not contain the @id attribute", self)
-                    return False
+            entity = self.__scan_entities__(context)["missing_id"]
+            if entity is not None:
+                context.result.add_issue(
+                    f"Entity \"{entity.get('name', None) or entity}\" "
+                    f"of RO-Crate \"{context.rel_fd_path}\" "
+                    "file descriptor does not contain the @id attribute", self)
+                return False
             return True
         except Exception as e:
             if logger.isEnabledFor(logging.DEBUG):
@@ -153,14 +172,13 @@ class FileDescriptorJsonLdFormat(PyFunctionCheck):
     def check_types(self, context: ValidationContext) -> bool:
         """ Check if the file descriptor entities have the @type property """
         try:
-            json_dict = context.ro_crate.metadata.as_dict()
-            for entity in json_dict["@graph"]:
-                if "@type" not in entity:
-                    context.result.add_issue(
-                        f"Entity \"{entity.get('name', None) or entity}\" "
-                        f"of RO-Crate \"{context.rel_fd_path}\" "
-                        "file descriptor does not contain the @type attribute", self)
-                    return False
+            entity = self.__scan_entities__(context)["missing_type"]
+            if entity is not None:
+                context.result.add_issue(
+                    f"Entity \"{entity.get('name', None) or entity}\" "
+                    f"of RO-Crate \"{context.rel_fd_path}\" "
+                    "file descriptor does not contain the @type attribute", self)
+                return False
             return True
         except Exception as e:
             if logger.isEnabledFor(logging.DEBUG):
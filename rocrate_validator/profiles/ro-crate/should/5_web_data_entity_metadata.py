@@ -12,14 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional
+
 import rocrate_validator.log as logging
 from rocrate_validator.models import ValidationContext
 from rocrate_validator.requirements.python import (PyFunctionCheck, check,
                                                    requirement)
+from rocrate_validator.rocrate import HTTP_POOL_MAXSIZE, ROCrateEntity
 
 # set up logging
 logger = logging.getLogger(__name__)
 
+# maximum number of Web-based Data Entities probed concurrently,
+# i.e., the number of connections the HTTP session keeps open to each host
+MAX_CONCURRENT_PROBES = HTTP_POOL_MAXSIZE
+
 
 @requirement(name="Web-based Data Entity: RECOMMENDED resource availability")
 class WebDataEntityRecommendedChecker(PyFunctionCheck):
@@ -28,23 +36,44 @@ class WebDataEntityRecommendedChecker(PyFunctionCheck):
     at the URIs specified in the `@id` property of the Web-based Data Entity.
     """
 
+    @staticmethod
+    def __probe_entities__(probe: Callable[[ROCrateEntity], Any],
+                           entities: list[ROCrateEntity], fail_fast: bool = False) -> Iterable[Any]:
+        """
+        Apply the probe to the entities concurrently, since probing a remote resource
+        is bound by the network latency, and return the results in the order of the entities.
+        On fail_fast the entities are probed lazily, one at a time,
+        so that no probe is made after the first failure
+        """
+        if fail_fast or len(entities) <= 1:
+            return (probe(entity) for entity in entities)
+        with ThreadPoolExecutor(max_workers=min(len(entities), MAX_CONCURRENT_PROBES)) as executor:
+            return list(executor.map(probe, entities))
+
     @check(name="Web-based Data Entity: resource availability")
     def check_availability(self, context: ValidationContext) -> bool:
         """
         Check if the Web-based Data Entity is directly downloadable
         by a simple retrieval (e.g. HTTP GET) permitting redirection and HTTP/HTTPS URIs
         """
-        result = True
-        for entity in context.ro_crate.metadata.get_web_data_entities():
-            assert entity.id is not None, "Entity has no @id"
+        def probe(entity: ROCrateEntity) -> tuple[bool, Optional[Exception]]:
             try:
-                if not entity.is_available():
-                    context.result.add_issue(
-                        f'Web-based Data Entity {entity.id} is not available', self)
-                    result = False
+                return entity.is_available(), None
             except Exception as e:
+                return False, e
+
+        entities = context.ro_crate.metadata.get_web_data_entities()
+        for entity in entities:
+            assert entity.id is not None, "Entity has no @id"
+        result = True
+        for entity, (available, error) in zip(entities, self.__probe_entities__(probe, entities, context.fail_fast)):
+            if error is not None:
                 context.result.add_issue(
-                    f'Web-based Data Entity {entity.id} is not available: {e}', self)
+                    f'Web-based Data Entity {entity.id} is not available: {error}', self)
+                result = False
+            elif not available:
+                context.result.add_issue(
+                    f'Web-based Data Entity {entity.id} is not available', self)
                 result = False
             if not result and context.fail_fast:
                 return result
@@ -56,16 +85,33 @@ class WebDataEntityRecommendedChecker(PyFunctionCheck):
         Check if the Web-based Data Entity has a `contentSize` property
         and if it is set to actual size of the downloadable content
         """
-        result = True
-        for entity in context.ro_crate.metadata.get_web_data_entities():
+        def probe(entity: ROCrateEntity) -> tuple[bool, Optional[int], Optional[Exception]]:
+            try:
+                if not entity.is_available():
+                    return False, None, None
+                actual_size = None
+                if entity.get_property("contentSize"):
+                    actual_size = entity.get_size()
+                return True, actual_size, None
+            except Exception as e:
+                return False, None, e
+
+        entities = context.ro_crate.metadata.get_web_data_entities()
+        for entity in entities:
             assert entity.id is not None, "Entity has no @id"
-            if entity.is_available():
+        result = True
+        probes = self.__probe_entities__(probe, entities, context.fail_fast)
+        for entity, (available, actual_size, error) in zip(entities, probes):
+            # errors are raised in the order of the entities, as if they were probed one by one
+            if error is not None:
+                raise error
+            if available:
                 content_size = entity.get_property("contentSize")
-                if content_size and int(content_size) != context.ro_crate.get_external_file_size(entity.id):
+                if content_size and int(content_size) != actual_size:
                     context.result.add_issue(
                         f'The property contentSize={content_size} of the Web-based Data Entity '
                         f'{entity.id} does not match the actual size of '
-                        f'the downloadable content, i.e., {entity.content_size} (bytes)', self,
+                        f'the downloadable content, i.e., {actual_size} (bytes)', self,
                         violatingEntity=entity.id, violatingProperty='contentSize', violatingPropertyValue=content_size)
                     result = False
             if not result and context.fail_fast:
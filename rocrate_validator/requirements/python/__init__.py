@@ -53,6 +53,14 @@ class PyFunctionCheck(RequirementCheck):
 
         self._check_function = check_function
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # collect the functions marked by the check decorator once, when the class is created
+        cls.__rq_checks__ = tuple((name, member)
+                                  for name, member in inspect.getmembers(cls, inspect.isfunction)
+                                  # verify that the attribute set by the check decorator is present
+                                  if getattr(member, "check", False) is True)
+
     def execute_check(self, context: ValidationContext) -> bool:
         return self._check_function(self, context)
 
@@ -88,34 +96,32 @@ class PyRequirement(Requirement):
     def __init_checks__(self):
         # initialize the list of checks
         checks = []
-        for name, member in inspect.getmembers(self.requirement_check_class, inspect.isfunction):
-            # verify that the attribute set by the check decorator is present
-            if hasattr(member, "check") and member.check is True:
-                check_name = None
-                try:
-                    check_name = member.name.strip()
-                except Exception:
-                    check_name = name.strip()
-                check_description = member.__doc__.strip() if member.__doc__ else ""
-                # init the check with the requirement level
-                severity = None
-                try:
-                    severity = member.severity
-                    logger.debug("Severity set for check '%r' from decorator: %r", check_name, severity)
-                except Exception:
-                    pass
-                if not severity:
-                    logger.debug(f"No explicit severity set for check '{check_name}' from decorator."
-                                 f"Getting severity from path: {self.severity_from_path}")
-                    severity = self.severity_from_path or Severity.REQUIRED
-                logger.debug("Severity log: %r", severity)
-                check = self.requirement_check_class(self,
-                                                     check_name,
-                                                     member,
-                                                     description=check_description,
-                                                     level=LevelCollection.get(severity.name) if severity else None)
-                self._checks.append(check)
-                logger.debug("Added check: %s %r", check_name, check)
+        for name, member in self.requirement_check_class.__rq_checks__:
+            check_name = None
+            try:
+                check_name = member.name.strip()
+            except Exception:
+                check_name = name.strip()
+            check_description = member.__doc__.strip() if member.__doc__ else ""
+            # init the check with the requirement level
+            severity = None
+            try:
+                severity = member.severity
+                logger.debug("Severity set for check '%r' from decorator: %r", check_name, severity)
+            except Exception:
+                pass
+            if not severity:
+                logger.debug(f"No explicit severity set for check '{check_name}' from decorator."
+                             f"Getting severity from path: {self.severity_from_path}")
+                severity = self.severity_from_path or Severity.REQUIRED
+            logger.debug("Severity log: %r", severity)
+            check = self.requirement_check_class(self,
+                                                 check_name,
+                                                 member,
+                                                 description=check_description,
+                                                 level=LevelCollection.get(severity.name) if severity else None)
+            self._checks.append(check)
+            logger.debug("Added check: %s %r", check_name, check)
 
         return checks
 
@@ -16,6 +16,8 @@ import json
 from timeit import default_timer as timer
 from typing import Optional
 
+from rdflib.term import Node
+
 import rocrate_validator.log as logging
 from rocrate_validator.errors import ROCrateMetadataNotFoundError
 from rocrate_validator.events import EventType
@@ -120,7 +122,7 @@ class SHACLCheck(RequirementCheck):
             logger.debug("SHACL Validation of profile %s already processed", self.requirement.profile.identifier)
             # The check belongs to a profile which has already been processed
             # so we can skip the validation and return the specific result for the check
-            return self not in [i.check for i in context.result.get_issues()]
+            return not context.result.get_issues_by_check(self)
         except SHACLValidationSkip as e:
             logger.debug("SHACL Validation of profile %s requirement %s skipped",
                          self.requirement.profile.identifier, self.identifier)
@@ -139,14 +141,14 @@ class SHACLCheck(RequirementCheck):
         start_time = timer()
         ontology_graph = shacl_context.ontology_graph
         end_time = timer()
-        logger.debug(f"Execution time for getting ontology graph: {end_time - start_time} seconds")
+        logger.debug("Execution time for getting ontology graph: %s seconds", end_time - start_time)
 
         data_graph = None
         try:
             start_time = timer()
             data_graph = shacl_context.data_graph
             end_time = timer()
-            logger.debug(f"Execution time for getting data graph: {end_time - start_time} seconds")
+            logger.debug("Execution time for getting data graph: %s seconds", end_time - start_time)
         except json.decoder.JSONDecodeError as e:
             logger.debug("Unable to perform metadata validation "
                          "due to one or more errors in the JSON-LD data file: %s", e)
@@ -159,7 +161,7 @@ class SHACLCheck(RequirementCheck):
         start_time = timer()
         shapes_graph = shapes_registry.shapes_graph
         end_time = timer()
-        logger.debug(f"Execution time for getting shapes: {end_time - start_time} seconds")
+        logger.debug("Execution time for getting shapes: %s seconds", end_time - start_time)
 
         # # uncomment to save the graphs to the logs folder (for debugging purposes)
         # start_time = timer()
@@ -174,13 +176,13 @@ class SHACLCheck(RequirementCheck):
         start_time = timer()
         shacl_validator = SHACLValidator(shapes_graph=shapes_graph, ont_graph=ontology_graph)
         shacl_result = shacl_validator.validate(
-            data_graph=data_graph, ontology_graph=ontology_graph, **shacl_context.settings.to_dict())
+            data_graph=data_graph, ontology_graph=ontology_graph, abort_on_first=shacl_context.fail_fast)
         # shacl_result.results_graph.serialize("logs/validation_results.ttl", format="turtle")
         # parse the validation result
         end_time = timer()
         logger.debug("Validation '%s' conforms: %s", self.name, shacl_result.conforms)
         logger.debug("Number of violations: %s", len(shacl_result.violations))
-        logger.debug(f"Execution time for validating the data graph: {end_time - start_time} seconds")
+        logger.debug("Execution time for validating the data graph: %s seconds", end_time - start_time)
 
         # store the validation result in the context
         start_time = timer()
@@ -189,12 +191,19 @@ class SHACLCheck(RequirementCheck):
         failed_requirements_checks_violations: dict[str, SHACLViolation] = {}
         failed_requirement_checks_notified = []
         logger.debug("Parsing Validation with result: %s", shacl_result)
+        # map each source shape to its requirement check only once:
+        # several violations usually share the same source shape
+        # and computing the key of a blank node shape requires hashing its triples
+        checks_by_source_shape: dict[Node, SHACLCheck] = {}
         # process the failed checks to extract the requirement checks involved
         for violation in shacl_result.violations:
-            shape = shapes_registry.get_shape(Shape.compute_key(shapes_graph, violation.sourceShape))
-            assert shape is not None, "Unable to map the violation to a shape"
-            requirementCheck = SHACLCheck.get_instance(shape)
-            assert requirementCheck is not None, "The requirement check cannot be None"
+            requirementCheck = checks_by_source_shape.get(violation.sourceShape, None)
+            if requirementCheck is None:
+                shape = shapes_registry.get_shape(Shape.compute_key(shapes_graph, violation.sourceShape))
+                assert shape is not None, "Unable to map the violation to a shape"
+                requirementCheck = SHACLCheck.get_instance(shape)
+                assert requirementCheck is not None, "The requirement check cannot be None"
+                checks_by_source_shape[violation.sourceShape] = requirementCheck
             failed_requirements_checks.add(requirementCheck)
             violations = failed_requirements_checks_violations.get(requirementCheck.identifier, None)
             if violations is None:
@@ -213,18 +222,14 @@ class SHACLCheck(RequirementCheck):
                 violating_entity = make_uris_relative(violation.focusNode.toPython(), shacl_context.publicID)
                 violating_property = violation.resultPath.toPython() if violation.resultPath else None
                 violation_message = violation.get_result_message(shacl_context.rocrate_uri)
-                registered_check_issues = shacl_context.result.get_issues_by_check(requirementCheck)
-                skip_requirement_check = False
-                for check_issue in registered_check_issues:
-                    if check_issue.message == violation_message and \
-                            check_issue.violatingProperty == violating_property and \
-                            check_issue.violatingEntity == violating_entity and \
-                            check_issue.violatingPropertyValue == violation.value:
-                        skip_requirement_check = True
-                        break
+                # skip the violation if an identical issue has already been registered for the check
+                registered_check_issue = shacl_context.result.get_issue(
+                    requirementCheck, violation_message, violating_entity, violating_property, violation.value)
+                skip_requirement_check = registered_check_issue is not None \
+                    and registered_check_issue.severity >= shacl_context.requirement_severity
                 if not skip_requirement_check:
                     c = shacl_context.result.add_issue(
-                        message=violation.get_result_message(shacl_context.rocrate_uri),
+                        message=violation_message,
                         check=requirementCheck,
                         violatingProperty=violating_property,
                         violatingEntity=violating_entity,
@@ -271,7 +276,7 @@ class SHACLCheck(RequirementCheck):
         for requirementCheck in shacl_context.result.skipped_checks:
             logger.debug("Remaining skipped check: %r - %s", requirementCheck.identifier, requirementCheck.name)
         end_time = timer()
-        logger.debug(f"Execution time for parsing the validation result: {end_time - start_time} seconds")
+        logger.debug("Execution time for parsing the validation result: %s seconds", end_time - start_time)
 
         return failed_requirements_checks
 
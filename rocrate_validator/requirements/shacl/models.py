@@ -17,13 +17,14 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional, Union
 
-from rdflib import Graph, Namespace, URIRef
+from rdflib import Graph, URIRef
 from rdflib.term import Node
 
-from rocrate_validator.constants import SHACL_NS
 import rocrate_validator.log as logging
 from rocrate_validator.models import LevelCollection, RequirementLevel, Severity
-from rocrate_validator.requirements.shacl.utils import (ShapesList,
+from rocrate_validator.requirements.shacl.utils import (SH_PATH, SH_PROPERTY,
+                                                        SHACL_SEVERITY_MAP,
+                                                        ShapesList,
                                                         compute_key,
                                                         inject_attributes)
 
@@ -119,13 +120,7 @@ class SHACLNode:
     def get_declared_severity(self) -> Optional[Severity]:
         """Return the declared severity of the shape"""
         severity = getattr(self, "severity", None)
-        if severity == f"{SHACL_NS}Violation":
-            return Severity.REQUIRED
-        elif severity == f"{SHACL_NS}Warning":
-            return Severity.RECOMMENDED
-        elif severity == f"{SHACL_NS}Info":
-            return Severity.OPTIONAL
-        return None
+        return SHACL_SEVERITY_MAP.get(severity) if isinstance(severity, str) else None
 
     def __str__(self):
         class_name = self.__class__.__name__
@@ -229,8 +224,7 @@ class PropertyShape(Shape):
         """Return the name of the shape property"""
         if not self._name:
             # get the object of the predicate sh:path
-            shacl_ns = Namespace(SHACL_NS)
-            path = self.graph.value(subject=self.node, predicate=shacl_ns.path)
+            path = self.graph.value(subject=self.node, predicate=SH_PATH)
             if path:
                 self._short_name = path.split("#")[-1] if "#" in path else path.split("/")[-1]
                 if self.parent:
@@ -338,12 +332,22 @@ class ShapesRegistry:
     def get_shapes(self) -> dict[str, Shape]:
         return self._shapes.copy()
 
-    @property
-    def shapes_graph(self) -> Graph:
+    def get_shapes_graph(self, copy: bool = True) -> Graph:
+        """
+        Return the graph of the registered shapes.
+        If `copy` is False, the graph of the registry is returned
+        (and it must not be modified by the caller).
+        """
+        if not copy:
+            return self._shapes_graph
         g = Graph()
         g += self._shapes_graph
         return g
 
+    @property
+    def shapes_graph(self) -> Graph:
+        return self.get_shapes_graph()
+
     def load_shapes(self, shapes_path: Union[str, Path], publicID: Optional[str] = None) -> list[Shape]:
         """
         Load the shapes from the graph
@@ -373,8 +377,7 @@ class ShapesRegistry:
             # create a node shape object
             shape = NodeShape(node_shape, node_graph)
             # load the nested properties
-            shacl_ns = Namespace(SHACL_NS)
-            nested_properties = node_graph.objects(subject=node_shape, predicate=shacl_ns.property)
+            nested_properties = node_graph.objects(subject=node_shape, predicate=SH_PROPERTY)
             for property_shape in nested_properties:
                 property_graph = shapes_list.get_shape_property_graph(node_shape, property_shape)
                 p_shape = PropertyShape(
@@ -431,7 +434,6 @@ def __process_property_group__(groups: dict[str, PropertyGroup], property_shape:
     if group_name:
         if group_name not in groups:
             groups[group_name] = PropertyGroup(URIRef(property_shape.group), property_shape.graph)
-        property_shape.graph.serialize("logs/property_shape.ttl", format="turtle")
         groups[group_name].add_property(property_shape)
         property_shape._property_group = groups[group_name]
         return groups[group_name]
@@ -39,17 +39,17 @@ class SHACLRequirement(Requirement):
         super().__init__(profile,
                          shape.name if shape.name else "",
                          shape.description if shape.description else "",
-                         path)
-        # init checks
+                         path, initialize_checks=False)
+        # init checks (only once: the base class initialization is skipped
+        # because the SHACL checks need the list returned by __init_checks__)
         self._checks = self.__init_checks__()
         # assign check IDs
         self.__reorder_checks__()
+        self._checks_initialized = True
 
     def __reorder_checks__(self) -> None:
-        i = 0
-        for check in self._checks:
+        for i, check in enumerate(self._checks):
             check.order_number = i
-            i += 1
 
     def __init_checks__(self) -> list[RequirementCheck]:
         # check if the shape is not None before creating checks
@@ -15,10 +15,12 @@
 from __future__ import annotations
 
 import hashlib
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
-from rdflib import RDF, BNode, Graph, Namespace
+from rdflib import RDF, BNode, Graph, Literal, Namespace, URIRef
 from rdflib.term import Node
 
 import rocrate_validator.log as logging
@@ -29,6 +31,27 @@ from rocrate_validator.models import Severity
 # set up logging
 logger = logging.getLogger(__name__)
 
+# SHACL terms used to read the shapes and the validation results
+SH_NODE_SHAPE = URIRef(f"{SHACL_NS}NodeShape")
+SH_PROPERTY_SHAPE = URIRef(f"{SHACL_NS}PropertyShape")
+SH_PROPERTY = URIRef(f"{SHACL_NS}property")
+SH_PATH = URIRef(f"{SHACL_NS}path")
+SH_CONFORMS = URIRef(f"{SHACL_NS}conforms")
+SH_FOCUS_NODE = URIRef(f"{SHACL_NS}focusNode")
+SH_RESULT_PATH = URIRef(f"{SHACL_NS}resultPath")
+SH_VALUE = URIRef(f"{SHACL_NS}value")
+SH_RESULT_SEVERITY = URIRef(f"{SHACL_NS}resultSeverity")
+SH_RESULT_MESSAGE = URIRef(f"{SHACL_NS}resultMessage")
+SH_SOURCE_SHAPE = URIRef(f"{SHACL_NS}sourceShape")
+SH_SOURCE_CONSTRAINT_COMPONENT = URIRef(f"{SHACL_NS}sourceConstraintComponent")
+
+# map of the SHACL severity terms to our Severity enum values
+SHACL_SEVERITY_MAP = {
+    f"{SHACL_NS}Violation": Severity.REQUIRED,
+    f"{SHACL_NS}Warning": Severity.RECOMMENDED,
+    f"{SHACL_NS}Info": Severity.OPTIONAL
+}
+
 
 def build_node_subgraph(graph: Graph, node: Node) -> Graph:
     shape_graph = Graph()
@@ -55,14 +78,10 @@ def map_severity(shacl_severity: str) -> Severity:
     """
     Map the SHACL severity term to our Severity enum values
     """
-    if f"{SHACL_NS}Violation" == shacl_severity:
-        return Severity.REQUIRED
-    elif f"{SHACL_NS}Warning" == shacl_severity:
-        return Severity.RECOMMENDED
-    elif f"{SHACL_NS}Info" == shacl_severity:
-        return Severity.OPTIONAL
-    else:
+    severity = SHACL_SEVERITY_MAP.get(shacl_severity)
+    if severity is None:
         raise RuntimeError(f"Unrecognized SHACL severity term {shacl_severity}")
+    return severity
 
 
 def make_uris_relative(text: str, ro_crate_path: Union[Path, str]) -> str:
@@ -70,16 +89,27 @@ def make_uris_relative(text: str, ro_crate_path: Union[Path, str]) -> str:
     return text.replace(str(ro_crate_path), './')
 
 
+@lru_cache(maxsize=None)
+def __get_shacl_property_name__(predicate: Node) -> Optional[str]:
+    """
+    Get the local name of a SHACL predicate, or None if the predicate is not in the SHACL namespace.
+    Names are cached, since shapes use a small set of SHACL predicates
+    """
+    predicate_as_string = predicate.toPython()
+    if predicate_as_string.startswith(SHACL_NS):
+        return predicate_as_string.split("#")[-1]
+    return None
+
+
 def inject_attributes(obj: object, node_graph: Graph, node: Node, exclude: Optional[list] = None) -> object:
     # inject attributes of the shape property
     # logger.debug("Injecting attributes of node %s", node)
     skip_properties = ["node"] if exclude is None else exclude + ["node"]
     triples = node_graph.triples((node, None, None))
     for node, p, o in triples:
-        predicate_as_string = p.toPython()
-        # logger.debug(f"Processing {predicate_as_string} of property graph {node}")
-        if predicate_as_string.startswith(SHACL_NS):
-            property_name = predicate_as_string.split("#")[-1]
+        property_name = __get_shacl_property_name__(p)
+        # logger.debug(f"Processing {p} of property graph {node}")
+        if property_name is not None:
             if property_name in skip_properties:
                 continue
             try:
@@ -150,6 +180,8 @@ class ShapesList:
         self._property_shapes = property_shapes
         self._shapes_graph = shapes_graph
         self._shapes_graphs = shapes_graphs
+        # subgraphs of the nested properties: (shape node, property node) -> Graph
+        self._property_graphs: dict[tuple[Node, Node], Graph] = {}
 
     @property
     def node_shapes(self) -> list[Node]:
@@ -189,19 +221,23 @@ class ShapesList:
         """
         Get the subgraph of the given shape node excluding the given property
         """
+        property_graph = self._property_graphs.get((shape_node, shape_property))
+        if property_graph is not None:
+            return property_graph
+
         node_graph = self.get_shape_graph(shape_node)
         assert node_graph is not None, "The shape graph cannot be None"
 
         property_graph = Graph()
-        shacl_ns = Namespace(SHACL_NS)
-        nested_properties_to_exclude = [o for (_, _, o) in node_graph.triples(
-            (shape_node, shacl_ns.property, None)) if o != shape_property]
-        triples_to_exclude = [(s, _, o) for (s, _, o) in node_graph.triples((None, None, None))
-                              if s in nested_properties_to_exclude
-                              or o in nested_properties_to_exclude]
+        nested_properties_to_exclude = {o for (_, _, o) in node_graph.triples(
+            (shape_node, SH_PROPERTY, None)) if o != shape_property}
 
-        property_graph += node_graph - triples_to_exclude
+        # copy the node graph skipping the triples which involve the other nested properties
+        property_graph += ((s, p, o) for (s, p, o) in node_graph
+                           if s not in nested_properties_to_exclude
+                           and o not in nested_properties_to_exclude)
 
+        self._property_graphs[(shape_node, shape_property)] = property_graph
         return property_graph
 
     @classmethod
@@ -231,27 +267,28 @@ class ShapesList:
 
 def __extract_related_triples__(graph, subject_node, processed_nodes=None):
     """
-    Recursively extract all triples related to a given shape.
+    Extract all triples related to a given shape,
+    i.e., the triples reachable from the shape node.
     """
 
     related_triples = []
 
     processed_nodes = processed_nodes if processed_nodes is not None else set()
 
-    # Skip the current node if it has already been processed
-    if subject_node in processed_nodes:
-        return related_triples
-
-    # Add the current node to the processed nodes
-    processed_nodes.add(subject_node)
-
-    # Directly related triples
-    related_triples.extend((_, p, o) for (_, p, o) in graph.triples((subject_node, None, None)))
-
-    # Recursively find triples related to nested shapes
-    for _, _, object_node in related_triples:
-        if isinstance(object_node, Node):
-            related_triples.extend(__extract_related_triples__(graph, object_node, processed_nodes))
+    # Visit the nodes reachable from the shape node,
+    # skipping literals which cannot be the subject of other triples
+    nodes_to_process = [subject_node]
+    while nodes_to_process:
+        node = nodes_to_process.pop()
+        # Skip the current node if it has already been processed
+        if node in processed_nodes:
+            continue
+        processed_nodes.add(node)
+        for triple in graph.triples((node, None, None)):
+            related_triples.append(triple)
+            object_node = triple[2]
+            if not isinstance(object_node, Literal) and object_node not in processed_nodes:
+                nodes_to_process.append(object_node)
 
     return related_triples
 
@@ -260,24 +297,33 @@ def load_shapes_from_file(file_path: str, publicID: str = None) -> ShapesList:
     try:
         # Check the file path is not None
         assert file_path is not None, "The file path cannot be None"
-        # Load the graph from the file
-        g = Graph()
-        g.parse(file_path, format="turtle", publicID=publicID)
-        # Extract the shapes from the graph
-        return load_shapes_from_graph(g)
+        # Load the shapes from the file
+        return __load_shapes_list__(str(file_path), os.stat(file_path).st_mtime_ns, publicID)
     except Exception as e:
         raise BadSyntaxError(str(e), file_path) from e
 
 
+@lru_cache(maxsize=256)
+def __load_shapes_list__(file_path: str, mtime_ns: int, publicID: Optional[str] = None) -> ShapesList:
+    """
+    Parse the shapes file and extract its shapes. Shapes files are static,
+    so the list of shapes is cached per file, modification time and public ID
+    and shared by the profiles loaded from the same file (its graphs must not be modified).
+    """
+    logger.debug("Parsing shapes file %s (mtime: %r)", file_path, mtime_ns)
+    g = Graph()
+    g.parse(file_path, format="turtle", publicID=publicID)
+    # Extract the shapes from the graph
+    return load_shapes_from_graph(g)
+
+
 def load_shapes_from_graph(g: Graph) -> ShapesList:
-    # define the SHACL namespace
-    SHACL = Namespace(SHACL_NS)
     # find all NodeShapes
     node_shapes = [s for (s, _, _) in g.triples(
-        (None, RDF.type, SHACL.NodeShape)) if not isinstance(s, BNode)]
+        (None, RDF.type, SH_NODE_SHAPE)) if not isinstance(s, BNode)]
     logger.debug("Loaded Node Shapes: %s", node_shapes)
     # find all PropertyShapes
-    property_shapes = [s for (s, _, _) in g.triples((None, RDF.type, SHACL.PropertyShape))
+    property_shapes = [s for (s, _, _) in g.triples((None, RDF.type, SH_PROPERTY_SHAPE))
                        if not isinstance(s, BNode)]
     logger.debug("Loaded Property Shapes: %s", property_shapes)
     # define the list of shapes to extract
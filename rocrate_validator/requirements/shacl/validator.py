@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
@@ -26,11 +27,13 @@ from rdflib.term import Node, URIRef
 import rocrate_validator.log as logging
 from rocrate_validator.models import (Profile, RequirementCheck, Severity,
                                       ValidationContext, ValidationResult)
-from rocrate_validator.requirements.shacl.utils import (make_uris_relative,
-                                                        map_severity)
+from rocrate_validator.requirements.shacl.utils import (
+    SH_CONFORMS, SH_FOCUS_NODE, SH_RESULT_MESSAGE, SH_RESULT_PATH,
+    SH_RESULT_SEVERITY, SH_SOURCE_CONSTRAINT_COMPONENT, SH_SOURCE_SHAPE,
+    SH_VALUE, make_uris_relative, map_severity)
 
 from ...constants import (DEFAULT_ONTOLOGY_FILE, RDF_SERIALIZATION_FORMATS,
-                          RDF_SERIALIZATION_FORMATS_TYPES, SHACL_NS,
+                          RDF_SERIALIZATION_FORMATS_TYPES,
                           VALID_INFERENCE_OPTIONS,
                           VALID_INFERENCE_OPTIONS_TYPES)
 from .models import ShapesRegistry
@@ -39,6 +42,18 @@ from .models import ShapesRegistry
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def __parse_ontology_graph__(file_path: str, mtime_ns: int, publicID: Optional[str] = None) -> Graph:
+    """
+    Parse the ontology file of a profile. The parsed graph is cached per file,
+    modification time and public ID and shared by the validation contexts
+    (it is only merged into the contextual ontology graph, never modified).
+    """
+    ontology_graph = Graph()
+    ontology_graph.parse(file_path, format="ttl", publicID=publicID)
+    return ontology_graph
+
+
 class SHACLValidationSkip(Exception):
     pass
 
@@ -91,7 +106,8 @@ class SHACLValidationContextManager:
 class SHACLValidationContext(ValidationContext):
 
     def __init__(self, context: ValidationContext):
-        super().__init__(context.validator, context.settings)
+        # share the RO-Crate instance with the base context
+        super().__init__(context.validator, context.settings, ro_crate=context.ro_crate)
         self._base_context: ValidationContext = context
         # reference to the ontology path
         self._ontology_path: Path = None
@@ -120,23 +136,28 @@ class SHACLValidationContext(ValidationContext):
             # augment the shapes registry with the profile shapes
             profile_registry = ShapesRegistry.get_instance(profile)
             profile_shapes = profile_registry.get_shapes()
-            profile_shapes_graph = profile_registry.shapes_graph
+            # the profile shapes graph is copied only if some shapes have to be removed
+            profile_shapes_graph = None
             logger.debug("Loaded shapes: %s", profile_shapes)
 
             # enable overriding of checks
             if self.settings.allow_requirement_check_override:
                 from rocrate_validator.requirements.shacl.requirements import \
                     SHACLRequirement
-                for requirement in [_ for _ in profile.requirements if isinstance(_, SHACLRequirement)]:
+                for requirement in profile.get_requirements_by_type(SHACLRequirement):
                     # logger.debug("Processing requirement: %s", requirement.name)
                     for check in requirement.get_checks():
                         # logger.debug("Processing check: %s", check)
                         if check.overridden and check.requirement.profile != self.target_profile:
                             # logger.debug("Overridden check: %s", check)
+                            if profile_shapes_graph is None:
+                                profile_shapes_graph = profile_registry.shapes_graph
                             profile_shapes_graph -= check.shape.graph
                             profile_shapes.pop(check.shape.key)
 
             # add the shapes to the registry
+            if profile_shapes_graph is None:
+                profile_shapes_graph = profile_registry.get_shapes_graph(copy=False)
             self._shapes_registry.extend(profile_shapes, profile_shapes_graph)
             # set the current validation profile
             self._current_validation_profile = profile
@@ -176,6 +197,14 @@ class SHACLValidationContext(ValidationContext):
     def result(self) -> ValidationResult:
         return self.base_context.result
 
+    def get_data_graph(self, refresh: bool = False) -> Graph:
+        # the RO-Crate metadata is parsed only once and shared with the base context
+        return self.base_context.get_data_graph(refresh=refresh)
+
+    def __get_profiles__(self) -> list[Profile]:
+        # the profiles are loaded only once and shared with the base context
+        return self.base_context.__get_profiles__()
+
     @property
     def shapes_registry(self) -> ShapesRegistry:
         return self._shapes_registry
@@ -196,9 +225,8 @@ class SHACLValidationContext(ValidationContext):
         ontology_path = self.__get_ontology_path__(profile_path, ontology_filename)
         if os.path.exists(ontology_path):
             logger.debug("Loading ontologies: %s", ontology_path)
-            ontology_graph = Graph()
-            ontology_graph.parse(ontology_path, format="ttl",
-                                 publicID=self.publicID)
+            ontology_graph = __parse_ontology_graph__(
+                str(ontology_path), os.stat(ontology_path).st_mtime_ns, self.publicID)
             logger.debug("Ontologies loaded: %s", ontology_graph)
         return ontology_graph
 
@@ -217,7 +245,14 @@ class SHACLValidationContext(ValidationContext):
 
 class SHACLViolation:
 
-    def __init__(self, result: ValidationResult, violation_node: Node, graph: Graph) -> None:
+    # a violation is created for every result of the SHACL report:
+    # slots keep the per-instance footprint small
+    __slots__ = ('_result', '_violation_node', '_graph', '_properties',
+                 '_focus_node', '_result_message', '_result_path', '_severity',
+                 '_source_constraint_component', '_source_shape_node', '_value')
+
+    def __init__(self, result: ValidationResult, violation_node: Node, graph: Graph,
+                 properties: Optional[dict[Node, Node]] = None) -> None:
         # check the input
         assert result is not None, "Invalid result"
         assert isinstance(violation_node, Node), "Invalid violation node"
@@ -227,6 +262,12 @@ class SHACLViolation:
         self._result = result
         self._violation_node = violation_node
         self._graph = graph
+        # map of the properties of the violation node: predicate -> object
+        if properties is None:
+            properties = {}
+            for p, o in graph.predicate_objects(violation_node):
+                properties.setdefault(p, o)
+        self._properties = properties
 
         # initialize the properties for lazy loading
         self._focus_node = None
@@ -234,7 +275,6 @@ class SHACLViolation:
         self._result_path = None
         self._severity = None
         self._source_constraint_component = None
-        self._source_shape = None
         self._source_shape_node = None
         self._value = None
 
@@ -249,25 +289,25 @@ class SHACLViolation:
     @property
     def focusNode(self) -> Node:
         if not self._focus_node:
-            self._focus_node = self.graph.value(self._violation_node, URIRef(f"{SHACL_NS}focusNode"))
+            self._focus_node = self._properties.get(SH_FOCUS_NODE)
             assert self._focus_node is not None, f"Unable to get focus node from violation node {self._violation_node}"
         return self._focus_node
 
     @property
     def resultPath(self):
         if not self._result_path:
-            self._result_path = self.graph.value(self._violation_node, URIRef(f"{SHACL_NS}resultPath"))
+            self._result_path = self._properties.get(SH_RESULT_PATH)
         return self._result_path
 
     @property
     def value(self):
         if not self._value:
-            self._value = self.graph.value(self._violation_node, URIRef(f"{SHACL_NS}value"))
+            self._value = self._properties.get(SH_VALUE)
         return self._value
 
     def get_result_severity(self) -> Severity:
         if not self._severity:
-            severity = self.graph.value(self._violation_node, URIRef(f"{SHACL_NS}resultSeverity"))
+            severity = self._properties.get(SH_RESULT_SEVERITY)
             assert severity is not None, f"Unable to get severity from violation node {self._violation_node}"
             # we need to map the SHACL severity term to our Severity enum values
             self._severity = map_severity(severity.toPython())
@@ -276,15 +316,15 @@ class SHACLViolation:
     @property
     def sourceConstraintComponent(self):
         if not self._source_constraint_component:
-            self._source_constraint_component = self.graph.value(
-                self._violation_node, URIRef(f"{SHACL_NS}sourceConstraintComponent"))
+            self._source_constraint_component = self._properties.get(
+                SH_SOURCE_CONSTRAINT_COMPONENT)
             assert self._source_constraint_component is not None, \
                 f"Unable to get source constraint component from violation node {self._violation_node}"
         return self._source_constraint_component
 
     def get_result_message(self, ro_crate_path: Union[Path, str]) -> str:
         if not self._result_message:
-            message = self.graph.value(self._violation_node, URIRef(f"{SHACL_NS}resultMessage"))
+            message = self._properties.get(SH_RESULT_MESSAGE)
             assert message is not None, f"Unable to get result message from violation node {self._violation_node}"
             self._result_message = make_uris_relative(message.toPython(), ro_crate_path)
         return self._result_message
@@ -292,7 +332,7 @@ class SHACLViolation:
     @property
     def sourceShape(self) -> Union[URIRef, BNode]:
         if not self._source_shape_node:
-            self._source_shape_node = self.graph.value(self._violation_node, URIRef(f"{SHACL_NS}sourceShape"))
+            self._source_shape_node = self._properties.get(SH_SOURCE_SHAPE)
             assert self._source_shape_node is not None, \
                 f"Unable to get source shape node from violation node {self._violation_node}"
         return self._source_shape_node
@@ -306,7 +346,7 @@ class SHACLValidationResult:
         assert results_graph is not None, "Invalid graph"
         assert isinstance(results_graph, Graph), "Invalid graph type"
         # check if the graph is valid ValidationReport
-        assert (None, URIRef(f"{SHACL_NS}conforms"),
+        assert (None, SH_CONFORMS,
                 None) in results_graph, "Invalid ValidationReport"
         # store the input properties
         self.results_graph = results_graph
@@ -320,11 +360,18 @@ class SHACLValidationResult:
                      len(self._violations), self._conforms, self._text)
 
     def _parse_results_graph(self, results_graph: Graph):
+        # group the properties of the nodes of the results graph with a single pass over its triples
+        properties_by_node: dict[Node, dict[Node, Node]] = {}
+        for s, p, o in results_graph:
+            properties = properties_by_node.get(s)
+            if properties is None:
+                properties_by_node[s] = properties = {}
+            properties.setdefault(p, o)
         # parse the violations from the results graph
         violations = []
-        for violation_node in results_graph.subjects(predicate=URIRef(f"{SHACL_NS}resultMessage")):
-            violation = SHACLViolation(self, violation_node, results_graph)
-            violations.append(violation)
+        for violation_node, properties in properties_by_node.items():
+            if SH_RESULT_MESSAGE in properties:
+                violations.append(SHACLViolation(self, violation_node, results_graph, properties))
 
         return violations
 
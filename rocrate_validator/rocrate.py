@@ -16,22 +16,56 @@ from __future__ import annotations
 
 import io
 import json
+import os
 import struct
+import threading
 import zipfile
 from abc import ABC, abstractmethod
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 from typing import Optional, Union
 
 import requests
 from rdflib import Graph
+from requests.adapters import HTTPAdapter
 
 from rocrate_validator import log as logging
 from rocrate_validator.errors import ROCrateInvalidURIError
-from rocrate_validator.utils import URI, validate_rocrate_uri
+from rocrate_validator.utils import (URI, resolve_jsonld_context,
+                                     validate_rocrate_uri)
 
 # set up logging
 logger = logging.getLogger(__name__)
 
+# maximum number of connections kept open by the HTTP session to each host
+HTTP_POOL_MAXSIZE = 16
+
+# HTTP session used to probe the remote resources (HEAD requests),
+# so that the connections to the same hosts are reused, also by concurrent probes
+# (its connection pool is thread-safe); it is closed when a validation ends
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def __get_http_session__() -> requests.Session:
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _http_session = session
+        return _http_session
+
+
+def __close_http_session__() -> None:
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
 
 class ROCrateEntity:
 
@@ -93,20 +127,19 @@ class ROCrateEntity:
         try:
             # check if the entity points to an external file
             if self.id.startswith("http"):
-                return ROCrate.get_external_file_size(self.id) > 0
+                return self.ro_crate.__get_external_file_size__(self.id) > 0
 
             # check if the entity is part of the local RO-Crate
             if self.ro_crate.uri.is_local_resource():
                 # check if the file exists in the local file system
                 if isinstance(self.ro_crate, ROCrateLocalFolder):
-                    logger.debug("Checking local folder: %s", self.ro_crate.uri.as_path().absolute() / self.id)
-                    return self.ro_crate.has_file(
-                        self.ro_crate.uri.as_path().absolute() / self.id) \
-                        or self.ro_crate.has_directory(
-                        self.ro_crate.uri.as_path().absolute() / self.id)
+                    entity_path = self.ro_crate.__get_absolute_path__() / self.id
+                    logger.debug("Checking local folder: %s", entity_path)
+                    return self.ro_crate.has_file(entity_path) \
+                        or self.ro_crate.has_directory(entity_path)
                 # check if the file exists in the local zip file
                 if isinstance(self.ro_crate, ROCrateLocalZip):
-                    if self.id in [str(_) for _ in self.ro_crate.list_files()]:
+                    if self.id in self.ro_crate.__get_file_names__():
                         return self.ro_crate.get_file_size(Path(self.id)) > 0
 
             # check if the entity is part of the remote RO-Crate
@@ -121,6 +154,9 @@ class ROCrateEntity:
 
     def get_size(self) -> int:
         try:
+            # check if the entity points to an external file
+            if self.id.startswith("http"):
+                return self.ro_crate.__get_external_file_size__(self.id)
             return self.metadata.ro_crate.get_file_size(Path(self.id))
         except Exception as e:
             if logger.isEnabledFor(logging.DEBUG):
@@ -146,7 +182,13 @@ class ROCrateMetadata:
     def __init__(self, ro_crate: ROCrate) -> None:
         self._ro_crate = ro_crate
         self._dict = None
+        self._dict_error: json.JSONDecodeError = None
         self._json: str = None
+        self._graph: Graph = None
+        # index of the raw entities by @id, built on first use
+        self._entities_by_id: Optional[dict[str, dict]] = None
+        # positions of the entities in the @graph by @type, built on first use
+        self._entities_by_type: Optional[dict[str, list[int]]] = None
 
     @property
     def ro_crate(self) -> ROCrate:
@@ -195,11 +237,24 @@ class ROCrateMetadata:
             raise ValueError("no main workflow in metadata file descriptor")
         return main_workflow
 
+    def __get_entities_by_id__(self) -> dict[str, dict]:
+        if self._entities_by_id is None:
+            entities_by_id = {}
+            for entity in self.as_dict().get('@graph', []):
+                entity_id = entity.get('@id')
+                if entity_id is None or isinstance(entity_id, str):
+                    # the first entity with a given @id wins, as in a linear scan of the graph
+                    entities_by_id.setdefault(entity_id, entity)
+            self._entities_by_id = entities_by_id
+        return self._entities_by_id
+
     def get_entity(self, entity_id: str) -> ROCrateEntity:
-        for entity in self.as_dict().get('@graph', []):
-            if entity.get('@id') == entity_id:
-                return ROCrateEntity(self, entity)
-        return None
+        if entity_id is not None and not isinstance(entity_id, str):
+            return None
+        entity = self.__get_entities_by_id__().get(entity_id)
+        if entity is None:
+            return None
+        return ROCrateEntity(self, entity)
 
     def get_entities(self) -> list[ROCrateEntity]:
         entities = []
@@ -207,12 +262,32 @@ class ROCrateMetadata:
             entities.append(ROCrateEntity(self, entity))
         return entities
 
+    def __get_entities_by_type__(self) -> dict[str, list[int]]:
+        if self._entities_by_type is None:
+            entities_by_type = {}
+            for position, entity in enumerate(self.as_dict().get('@graph', [])):
+                entity_types = entity.get('@type')
+                for entity_type in (entity_types if isinstance(entity_types, list) else [entity_types]):
+                    if isinstance(entity_type, str):
+                        positions = entities_by_type.setdefault(entity_type, [])
+                        # an entity declaring the same type twice is indexed once
+                        if not positions or positions[-1] != position:
+                            positions.append(position)
+            self._entities_by_type = entities_by_type
+        return self._entities_by_type
+
     def get_entities_by_type(self, entity_type: Union[str, list[str]]) -> list[ROCrateEntity]:
-        entities = []
-        for e in self.get_entities():
-            if e.has_type(entity_type):
-                entities.append(e)
-        return entities
+        """
+        Get the entities having the given type (or any of the given types),
+        in the order they appear in the @graph
+        """
+        entities_by_type = self.__get_entities_by_type__()
+        if isinstance(entity_type, list):
+            positions = sorted({position for _ in entity_type for position in entities_by_type.get(_, [])})
+        else:
+            positions = entities_by_type.get(entity_type, [])
+        graph = self.as_dict().get('@graph', [])
+        return [ROCrateEntity(self, graph[position]) for position in positions]
 
     def get_dataset_entities(self) -> list[ROCrateEntity]:
         return self.get_entities_by_type('Dataset')
@@ -221,12 +296,8 @@ class ROCrateMetadata:
         return self.get_entities_by_type('File')
 
     def get_web_data_entities(self) -> list[ROCrateEntity]:
-        entities = []
-        for entity in self.get_entities():
-            if entity.has_type('File') or entity.has_type('Dataset'):
-                if entity.id.startswith("http"):
-                    entities.append(entity)
-        return entities
+        return [entity for entity in self.get_entities_by_type(['File', 'Dataset'])
+                if entity.id.startswith("http")]
 
     def get_conforms_to(self) -> Optional[list[str]]:
         try:
@@ -243,22 +314,30 @@ class ROCrateMetadata:
             return None
 
     def as_json(self) -> str:
-        if not self._json:
+        if self._json is None:
             self._json = self.ro_crate.get_file_content(
                 Path(self.METADATA_FILE_DESCRIPTOR), binary_mode=False)
         return self._json
 
     def as_dict(self) -> dict:
-        if not self._dict:
+        if self._dict is None:
+            # a descriptor that failed to parse is not parsed again:
+            # every check reading it gets the same error
+            if self._dict_error is not None:
+                raise self._dict_error.with_traceback(None)
             # if the dictionary is not cached, load it
-            self._dict = json.loads(self.as_json())
+            try:
+                self._dict = json.loads(self.as_json())
+            except json.JSONDecodeError as e:
+                self._dict_error = e
+                raise
         return self._dict
 
     def as_graph(self, publicID: str = None) -> Graph:
-        if not self._graph:
+        if self._graph is None:
             # if the graph is not cached, load it
             self._graph = Graph(base=publicID or self.ro_crate.uri)
-            self._graph.parse(data=self.as_json, format='json-ld')
+            self._graph.parse(data=resolve_jsonld_context(self.as_dict(), fetch_remote=True), format='json-ld')
         return self._graph
 
     def __str__(self) -> str:
@@ -292,6 +371,21 @@ class ROCrate(ABC):
         # store the path to the crate
         self._uri = URI(uri)
 
+        # absolute path of the local crate, computed on first use
+        self._absolute_path: Optional[Path] = None
+
+        # presence of the metadata descriptor, checked on first use
+        self._has_descriptor: Optional[bool] = None
+
+        # sizes of the external files (or the errors raised requesting them), by URI
+        self._external_file_sizes: dict[str, Union[int, Exception]] = {}
+
+        # status of the local paths (None if not found), by path
+        self._file_stats: dict[Path, Optional[os.stat_result]] = {}
+
+        # lock guarding the caches above, which can be filled by concurrent probes
+        self._cache_lock = threading.Lock()
+
         # cache the list of files
         self._files = None
 
@@ -341,6 +435,24 @@ class ROCrate(ABC):
         """
         pass
 
+    def __get_absolute_path__(self) -> Path:
+        if self._absolute_path is None:
+            self._absolute_path = self.uri.as_path().absolute()
+        return self._absolute_path
+
+    def __get_file_stat__(self, path: Path) -> Optional[os.stat_result]:
+        # each local path is checked once per crate, since several checks
+        # test the existence, the type and the size of the same files
+        with self._cache_lock:
+            if path in self._file_stats:
+                return self._file_stats[path]
+        try:
+            file_stat = path.stat()
+        except (OSError, ValueError):
+            file_stat = None
+        with self._cache_lock:
+            return self._file_stats.setdefault(path, file_stat)
+
     def __parse_path__(self, path: Path) -> Path:
         assert path, "Path cannot be None"
         # if the path is absolute, return it
@@ -348,10 +460,10 @@ class ROCrate(ABC):
             return path
         try:
             # if the path is relative, try to resolve it
-            return self.uri.as_path().absolute() / path.relative_to(self.uri.as_path())
+            return self.__get_absolute_path__() / path.relative_to(self.uri.as_path())
         except ValueError:
             # if the path cannot be resolved, return the absolute path
-            return self.uri.as_path().absolute() / path
+            return self.__get_absolute_path__() / path
 
     def has_descriptor(self) -> bool:
         """
@@ -360,7 +472,9 @@ class ROCrate(ABC):
         :return: `True` if the RO-Crate has a metadata descriptor file, `False` otherwise
         :rtype: bool
         """
-        return (self.uri.as_path().absolute() / self.metadata.METADATA_FILE_DESCRIPTOR).is_file()
+        if self._has_descriptor is None:
+            self._has_descriptor = (self.__get_absolute_path__() / self.metadata.METADATA_FILE_DESCRIPTOR).is_file()
+        return self._has_descriptor
 
     def has_file(self, path: Path) -> bool:
         """
@@ -373,7 +487,8 @@ class ROCrate(ABC):
         :rtype: bool
         """
         try:
-            return self.__parse_path__(path).is_file()
+            file_stat = self.__get_file_stat__(self.__parse_path__(path))
+            return file_stat is not None and S_ISREG(file_stat.st_mode)
         except Exception as e:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.exception(e)
@@ -390,7 +505,8 @@ class ROCrate(ABC):
         :rtype: bool
         """
         try:
-            return self.__parse_path__(path).is_dir()
+            file_stat = self.__get_file_stat__(self.__parse_path__(path))
+            return file_stat is not None and S_ISDIR(file_stat.st_mode)
         except Exception as e:
             if logger.isEnabledFor(logging.DEBUG):
                 logger.exception(e)
@@ -443,6 +559,23 @@ class ROCrate(ABC):
         response.raise_for_status()
         return response.content if binary_mode else response.text
 
+    def __get_external_file_size__(self, uri: str) -> int:
+        # the size of each external file is requested once per crate,
+        # since several checks probe the same Web-based Data Entities
+        with self._cache_lock:
+            size = self._external_file_sizes.get(uri)
+        if size is None:
+            # the request is made outside the lock, so that different URIs are probed concurrently
+            try:
+                size = self.get_external_file_size(uri)
+            except Exception as e:
+                size = e
+            with self._cache_lock:
+                size = self._external_file_sizes.setdefault(uri, size)
+        if isinstance(size, Exception):
+            raise size.with_traceback(None)
+        return size
+
     @staticmethod
     def get_external_file_size(uri: str) -> int:
         """
@@ -456,7 +589,7 @@ class ROCrate(ABC):
 
         :raises requests.HTTPError: if the request fails
         """
-        response = requests.head(str(uri))
+        response = __get_http_session__().head(str(uri))
         response.raise_for_status()
         return int(response.headers.get('Content-Length'))
 
@@ -505,28 +638,40 @@ class ROCrateLocalFolder(ROCrate):
 
     @property
     def size(self) -> int:
-        return sum(f.stat().st_size for f in self.list_files() if f.is_file())
+        file_stats = (self.__get_file_stat__(f) for f in self.list_files())
+        return sum(_.st_size for _ in file_stats if _ is not None and S_ISREG(_.st_mode))
 
     def list_files(self) -> list[Path]:
         if not self._files:
-            self._files = []
-            base_path = self.uri.as_path()
-            for file in base_path.rglob('*'):
-                if file.is_file():
-                    self._files.append(base_path / file)
+            files = []
+            # walk the crate with scandir, which tells files and directories apart
+            # from the directory listing, without a stat call for each entry
+            directories = [self.uri.as_path()]
+            while directories:
+                with os.scandir(directories.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            directories.append(Path(entry.path))
+                        elif entry.is_file():
+                            files.append(Path(entry.path))
+            self._files = files
         return self._files
 
     def get_file_size(self, path: Path) -> int:
         path = self.__parse_path__(path)
-        if not self.has_file(path):
+        file_stat = self.__get_file_stat__(path)
+        if file_stat is None or not S_ISREG(file_stat.st_mode):
             raise FileNotFoundError(f"File not found: {path}")
-        return path.stat().st_size
+        return file_stat.st_size
 
     def get_file_content(self, path: Path, binary_mode: bool = True) -> Union[str, bytes]:
         path = self.__parse_path__(path)
-        if not self.has_file(path):
+        # read the file straight away: a missing file (or a directory)
+        # is detected by the read itself without an extra stat call
+        try:
+            return path.read_bytes() if binary_mode else path.read_text()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
             raise FileNotFoundError(f"File not found: {path}")
-        return path.read_bytes() if binary_mode else path.read_text()
 
 
 class ROCrateLocalZip(ROCrate):
@@ -539,8 +684,9 @@ class ROCrateLocalZip(ROCrate):
         if init_zip:
             self.__init_zip_reference__()
 
-        # cache the list of files
+        # cache the list of files and the set of their names
         self._files = None
+        self._file_names: Optional[frozenset[str]] = None
 
     def __del__(self):
         if self._zipref and self._zipref.fp is not None:
@@ -566,16 +712,19 @@ class ROCrateLocalZip(ROCrate):
         return self._zipref.getinfo(str(path))
 
     def has_descriptor(self) -> bool:
-        return ROCrateMetadata.METADATA_FILE_DESCRIPTOR in [str(_.name) for _ in self.list_files()]
+        if self._has_descriptor is None:
+            self._has_descriptor = any(_.name == ROCrateMetadata.METADATA_FILE_DESCRIPTOR
+                                       for _ in self.list_files())
+        return self._has_descriptor
 
     def has_file(self, path: Path) -> bool:
-        if path in self.list_files():
+        if str(path) in self.__get_file_names__():
             info = self.__get_file_info__(path)
             return not info.is_dir()
         return False
 
     def has_directory(self, path: Path) -> bool:
-        if path in self.list_files():
+        if str(path) in self.__get_file_names__():
             info = self.__get_file_info__(path)
             return info.is_dir()
         return False
@@ -587,6 +736,12 @@ class ROCrateLocalZip(ROCrate):
                 self._files.append(Path(file))
         return self._files
 
+    def __get_file_names__(self) -> frozenset[str]:
+        # names of the listed files, used for constant time lookups
+        if self._file_names is None:
+            self._file_names = frozenset(str(_) for _ in self.list_files())
+        return self._file_names
+
     def get_file_size(self, path: Path) -> int:
         return self._zipref.getinfo(str(path)).file_size
 
@@ -632,7 +787,7 @@ class ROCrateRemoteZip(ROCrateLocalZip):
 
     @property
     def size(self) -> int:
-        response = requests.head(str(self.uri))
+        response = __get_http_session__().head(str(self.uri))
         response.raise_for_status()  # Check if the request was successful
         file_size = response.headers.get('Content-Length')
         if file_size is not None:
@@ -14,10 +14,13 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
+import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from pathlib import Path
 from typing import Optional, Union
@@ -198,6 +201,97 @@ def get_profiles_path() -> Path:
     return Path(CURRENT_DIR) / constants.DEFAULT_PROFILES_PATH
 
 
+def get_jsonld_contexts_path() -> Path:
+    """
+    Get the path to the directory of the JSON-LD contexts shipped with the package
+
+    :return: The path to the JSON-LD contexts directory
+    """
+    return Path(CURRENT_DIR) / constants.DEFAULT_JSONLD_CONTEXTS_PATH
+
+
+@functools.lru_cache(maxsize=None)
+def get_local_jsonld_context(context_uri: str) -> Optional[dict]:
+    """
+    Get the local copy of a well-known JSON-LD context
+
+    :param context_uri: The URI of the JSON-LD context
+    :return: The context definition (i.e., the value of its `@context` key)
+             or None if no local copy of the context is available
+    """
+    context_file = constants.JSONLD_CONTEXT_FILES.get(context_uri)
+    if context_file is None:
+        return None
+    with open(get_jsonld_contexts_path() / context_file, encoding="utf-8") as f:
+        return json.load(f).get("@context")
+
+
+@functools.lru_cache(maxsize=128)
+def get_remote_jsonld_context(context_uri: str) -> Optional[dict]:
+    """
+    Get a remote JSON-LD context.
+    Contexts are fetched once per process, since the same contexts
+    are referenced by the RO-Crates validated in the same session
+
+    :param context_uri: The absolute URI of the JSON-LD context
+    :return: The context definition (i.e., the value of its `@context` key)
+             or None if the remote document doesn't define a context
+    """
+    logger.debug("Fetching the remote JSON-LD context: %s", context_uri)
+    response = requests.get(context_uri, headers={"Accept": "application/ld+json, application/json"},
+                            allow_redirects=True)
+    response.raise_for_status()
+    context_document = json.loads(response.text)
+    if not isinstance(context_document, dict):
+        return None
+    return context_document.get("@context")
+
+
+def resolve_jsonld_context(data: dict, fetch_remote: bool = False) -> dict:
+    """
+    Replace the references to well-known JSON-LD contexts in the `@context`
+    of a JSON-LD document with their local copies, so that the document
+    can be parsed without fetching them.
+
+    :param data: The JSON-LD document
+    :param fetch_remote: If True, also inline the other remote contexts,
+                         fetched through the process-wide context cache
+    :return: A shallow copy of the document with the local contexts inlined,
+             or the document itself if it doesn't reference any well-known context
+    """
+    context = data.get("@context") if isinstance(data, dict) else None
+    if context is None:
+        return data
+    is_list = isinstance(context, list)
+    items = context if is_list else [context]
+    remote_contexts = set()
+    if fetch_remote:
+        remote_contexts = {item for item in items
+                           if isinstance(item, str) and item.startswith(("http://", "https://"))
+                           and get_local_jsonld_context(item) is None}
+        # fetch several remote contexts concurrently to overlap their latencies:
+        # the following lookups are then served by the context cache
+        if len(remote_contexts) > 1:
+            with ThreadPoolExecutor(max_workers=len(remote_contexts)) as executor:
+                list(executor.map(get_remote_jsonld_context, remote_contexts))
+    resolved = []
+    replaced = False
+    for item in items:
+        local_context = None
+        if isinstance(item, str):
+            local_context = get_remote_jsonld_context(item) if item in remote_contexts \
+                else get_local_jsonld_context(item)
+        if local_context is not None:
+            replaced = True
+            item = local_context
+        resolved.append(item)
+    if not replaced:
+        return data
+    data = data.copy()
+    data["@context"] = resolved if is_list else resolved[0]
+    return data
+
+
 def get_format_extension(serialization_format: constants.RDF_SERIALIZATION_FORMATS_TYPES) -> str:
     """
     Get the file extension for the RDF serialization format
@@ -291,12 +385,24 @@ def get_classes_from_file(file_path: Path,
     if file_path.suffix != ".py":
         raise ValueError("The file is not a Python file")
 
+    # The classes are cached per file for the whole process, so that the module is inspected only once
+    # (as an imported module, an edited file is not imported again anyway)
+    classes = __get_classes_from_file__(str(file_path), filter_class, class_name_suffix)
+    return classes.copy()
+
+
+@functools.lru_cache(maxsize=None)
+def __get_classes_from_file__(file_path: str,
+                              filter_class: Optional[type] = None,
+                              class_name_suffix: Optional[str] = None) -> dict[str, type]:
     # Get the module name from the file path
-    module_name = file_path.stem
+    module_name = Path(file_path).stem
     logger.debug("Module: %r", module_name)
 
     # Add the directory containing the file to the system path
-    sys.path.insert(0, os.path.dirname(file_path))
+    module_dir = os.path.dirname(file_path)
+    if module_dir not in sys.path:
+        sys.path.insert(0, module_dir)
 
     # Import the module
     module = import_module(module_name)
@@ -311,9 +417,11 @@ def get_classes_from_file(file_path: Path,
     return classes
 
 
+@functools.lru_cache(maxsize=256)
 def get_requirement_name_from_file(file: Path, check_name: Optional[str] = None) -> str:
     """
-    Get the requirement name from the file
+    Get the requirement name from the file.
+    Results are cached, since profiles are reloaded on every validation
 
     :param file: The file
     :return: The requirement name
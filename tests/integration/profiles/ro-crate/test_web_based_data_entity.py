@@ -15,6 +15,7 @@
 import logging
 
 from rocrate_validator import models
+from rocrate_validator.rocrate import ROCrate
 from tests.ro_crates import InvalidDataEntity
 from tests.shared import do_entity_test
 
@@ -49,3 +50,17 @@ def test_invalid_recommended_sdDatePublished(invalid_datetime):
          "a `sdDatePublished` property to indicate when the absolute URL was accessed"],
         rocrate_entity_patch={"https://sort-and-change-case.cwl": {"datePublished": invalid_datetime}}
     )
+
+
+def test_web_data_entity_content_size_mismatch(monkeypatch):
+    """Test a web based data entity whose contentSize doesn't match the size of its downloadable content."""
+    monkeypatch.setattr(ROCrate, "get_external_file_size", staticmethod(lambda uri: 1024))
+    do_entity_test(
+        paths.no_sdDatePublished,
+        models.Severity.RECOMMENDED,
+        False,
+        ["Web-based Data Entity: RECOMMENDED resource availability"],
+        ["The property contentSize=42 of the Web-based Data Entity https://sort-and-change-case.cwl "
+         "does not match the actual size of the downloadable content, i.e., 1024 (bytes)"],
+        rocrate_entity_patch={"https://sort-and-change-case.cwl": {"contentSize": "42"}}
+    )
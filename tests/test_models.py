@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import pickle
+
 import pytest
 
 from rocrate_validator import models, services
@@ -53,6 +56,11 @@ def test_level_basics():
 
 def test_level_collection():
     assert LevelCollection.get('may') == LevelCollection.MAY
+    assert LevelCollection.get('SHOULD_NOT') is LevelCollection.SHOULD_NOT
+    with pytest.raises(ValueError):
+        LevelCollection.get('unknown')
+    with pytest.raises(ValueError):
+        LevelCollection.get('all')
 
     # Test ordering
     assert LevelCollection.MAY < LevelCollection.SHOULD
@@ -70,6 +78,17 @@ def test_level_collection():
     assert 'REQUIRED' in level_names
 
 
+def test_level_interning():
+    assert RequirementLevel('MAY', Severity.OPTIONAL) is LevelCollection.MAY
+    assert RequirementLevel('MAY', Severity.OPTIONAL) is not LevelCollection.OPTIONAL
+
+
+def test_level_copy_and_pickle():
+    assert copy.copy(LevelCollection.MAY) is LevelCollection.MAY
+    assert copy.deepcopy(LevelCollection.MAY) is LevelCollection.MAY
+    assert pickle.loads(pickle.dumps(LevelCollection.SHOULD_NOT)) is LevelCollection.SHOULD_NOT
+
+
 @pytest.fixture
 def validation_settings():
     return ValidationSettings(
@@ -110,6 +129,25 @@ def test_sortability_issues(validation_settings: ValidationSettings):
     assert one.check >= two.check
 
 
+def test_add_issue(validation_settings: ValidationSettings):
+    validation_settings.rocrate_uri = InvalidRootDataEntity().invalid_root_type
+    result: models.ValidationResult = services.validate(validation_settings)
+    check = next(iter(result.failed_checks))
+    issues_count = len(result.issues)
+    # unhashable values are accepted and can be looked up
+    value = ["a", {"b": 1}]
+    issue = result.add_issue("Test issue", check, violatingEntity="./",
+                             violatingProperty="p", violatingPropertyValue=value)
+    assert result.get_issue(check, "Test issue", "./", "p", list(value)) is issue
+    assert result.get_issue(check, "Test issue", "./", "p", ["b"]) is None
+    # every issue is added, even if identical to a previous one
+    duplicate = result.add_issue("Test issue", check, violatingEntity="./",
+                                 violatingProperty="p", violatingPropertyValue=value)
+    assert duplicate is not issue
+    assert result.get_issue(check, "Test issue", "./", "p", value) is issue
+    assert len(result.issues) == issues_count + 2
+
+
 def test_hidden_shape():
     rocrate_profile = services.get_profile("ro-crate-1.1")
     assert rocrate_profile is not None, "Profile should not be None"
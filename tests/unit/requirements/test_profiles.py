@@ -14,6 +14,7 @@
 
 import logging
 import os
+import shutil
 
 import pytest
 
@@ -21,8 +22,12 @@ from rocrate_validator.constants import DEFAULT_PROFILE_IDENTIFIER
 from rocrate_validator.errors import (DuplicateRequirementCheck,
                                       InvalidProfilePath,
                                       ProfileSpecificationError)
-from rocrate_validator.models import (Profile, ValidationContext,
+from rocrate_validator.models import (Profile, Requirement, RequirementLoader,
+                                      Severity, ValidationContext,
                                       ValidationSettings, Validator)
+from rocrate_validator.requirements.python import PyRequirement
+from rocrate_validator.requirements.shacl.requirements import \
+    SHACLRequirement
 from tests.ro_crates import InvalidFileDescriptorEntity, ValidROC
 
 # set up logging
@@ -51,6 +56,72 @@ def test_order_of_loaded_profiles(profiles_path: str):
     assert profile_names == profile_directories
 
 
+def test_profile_requirements_by_severity(profiles_path: str):
+    """Test the filtering of the profile requirements by severity."""
+    profile = Profile.load_profiles(profiles_path=profiles_path)[0]
+    required = profile.get_requirements(Severity.REQUIRED, exact_match=True)
+    assert len(required) > 0
+    assert all(r.severity_from_path == Severity.REQUIRED for r in required)
+    # the returned list should not alias the cached one
+    required.clear()
+    assert profile.get_requirements(Severity.REQUIRED, exact_match=True)
+    # the cache should be invalidated when requirements change
+    requirement = profile.get_requirements(Severity.REQUIRED, exact_match=True)[0]
+    profile.remove_requirement(requirement)
+    assert requirement not in profile.get_requirements(Severity.REQUIRED, exact_match=True)
+    assert requirement not in profile.get_requirements(Severity.OPTIONAL)
+    profile.add_requirement(requirement)
+    assert requirement in profile.get_requirements(Severity.REQUIRED, exact_match=True)
+
+
+def test_profile_requirements_by_type(profiles_path: str):
+    """Test the filtering of the profile requirements by type."""
+    profile = Profile.load_profiles(profiles_path=profiles_path)[0]
+    shacl_requirements = profile.get_requirements_by_type(SHACLRequirement)
+    python_requirements = profile.get_requirements_by_type(PyRequirement)
+    assert len(shacl_requirements) > 0
+    assert len(python_requirements) > 0
+    assert len(shacl_requirements) + len(python_requirements) == len(profile.requirements)
+    assert profile.get_requirements_by_type(Requirement) == profile.requirements
+    # the cache should be invalidated when requirements change
+    requirement = shacl_requirements[0]
+    profile.remove_requirement(requirement)
+    assert requirement not in profile.get_requirements_by_type(SHACLRequirement)
+    profile.add_requirement(requirement)
+    assert requirement in profile.get_requirements_by_type(SHACLRequirement)
+    assert profile.get_requirement(requirement.name) is requirement
+
+
+def test_profile_without_requirements_loaded_once(fake_profiles_path: str, monkeypatch):
+    """Test that the requirements of a profile without requirements are loaded only once."""
+    profile = Profile.load(fake_profiles_path, f"{fake_profiles_path}/d1")
+    calls = []
+    load_requirements = RequirementLoader.load_requirements
+
+    def counting_load_requirements(*args, **kwargs):
+        calls.append(args)
+        return load_requirements(*args, **kwargs)
+
+    monkeypatch.setattr(RequirementLoader, "load_requirements", counting_load_requirements)
+    assert profile.requirements == []
+    assert profile.requirements == []
+    assert profile.get_requirement("unknown") is None
+    assert len(calls) == 1, "The requirements should be loaded only once"
+
+
+def test_profile_requirements_in_hidden_directories_ignored(fake_profiles_path: str, tmp_path):
+    """Test that the requirement files in hidden directories are not loaded."""
+    profile_path = tmp_path / "a"
+    shutil.copytree(f"{fake_profiles_path}/a", profile_path)
+    hidden_path = profile_path / ".hidden"
+    hidden_path.mkdir()
+    shutil.copy(profile_path / "shape_a.ttl", hidden_path / "shape_hidden.ttl")
+
+    profile = Profile.load(tmp_path, profile_path)
+    assert len(profile.requirements) > 0
+    assert all(hidden_path not in requirement.path.parents for requirement in profile.requirements)
+
+
 def test_load_invalid_profile_from_validation_context(fake_profiles_path: str):
     """Test the loaded profiles from the validator context."""
     settings = {
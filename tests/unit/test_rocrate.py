@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 from pathlib import Path
 import pytest
 
@@ -25,7 +26,9 @@ from rocrate_validator.rocrate import (
     ROCrateMetadata,
     ROCrateRemoteZip,
 )
-from tests.ro_crates import ValidROC
+from rocrate_validator import utils
+from rocrate_validator.utils import resolve_jsonld_context
+from tests.ro_crates import InvalidFileDescriptor, ValidROC
 
 # set up logging
 logger = logging.getLogger(__name__)
@@ -93,6 +96,16 @@ def test_valid_local_rocrate():
     assert root_data_entity.name == "Recording provenance of workflow runs with RO-Crate (RO-Crate and mapping)", \
         "Name should be wrroc-paper"
 
+    # test missing entity
+    assert metadata.get_entity("does-not-exist") is None, "Missing entities should be None"
+
+    # test entities by type
+    data_entities = metadata.get_entities_by_type(["File", "Dataset"])
+    assert [e.id for e in data_entities] == \
+        [e.id for e in metadata.get_entities() if e.has_types(["File", "Dataset"])], \
+        "Entities should be returned in the order of the @graph"
+    assert metadata.get_entities_by_type("does-not-exist") == [], "Missing types should have no entities"
+
     # check metadata consistency
     assert root_data_entity.metadata == metadata, "Metadata should be the same"
     assert root_data_entity.metadata == roc.metadata, "Metadata should be the same"
@@ -231,6 +244,108 @@ def test_valid_remote_zip_rocrate():
     assert main_entity.is_available(), "Main entity should be available"
 
 
+def test_metadata_graph_with_local_context():
+    roc = ROCrateLocalFolder(ValidROC().wrroc_paper)
+
+    # the well-known RO-Crate context is replaced by its local copy
+    metadata_dict = roc.metadata.as_dict()
+    resolved_dict = resolve_jsonld_context(metadata_dict)
+    assert resolved_dict is not metadata_dict, "A copy of the metadata should be returned"
+    assert metadata_dict["@context"][0] == "https://w3id.org/ro/crate/1.1/context", \
+        "The original metadata should not be modified"
+    assert isinstance(resolved_dict["@context"][0], dict), "The context should be inlined"
+    assert resolved_dict["@context"][0]["name"] == "http://schema.org/name"
+    assert resolved_dict["@context"][1:] == metadata_dict["@context"][1:], \
+        "Other contexts should be preserved"
+
+    # documents without well-known contexts are returned as they are
+    unknown_context = {"@context": ["https://example.org/context", {"@vocab": "http://schema.org/"}]}
+    assert resolve_jsonld_context(unknown_context) is unknown_context
+
+    # the metadata graph can be built without fetching the context
+    graph = roc.metadata.as_graph()
+    assert len(graph) > 0, "The metadata graph should not be empty"
+
+
+class FakeContextResponse:
+
+    def __init__(self, document: dict):
+        self.text = json.dumps(document)
+
+    def raise_for_status(self):
+        pass
+
+
+def test_remote_jsonld_context_fetched_once(monkeypatch):
+    fetched = []
+
+    def fake_get(url, **kwargs):
+        fetched.append(url)
+        return FakeContextResponse({"@context": {"@vocab": "http://example.org/"}})
+    monkeypatch.setattr(utils.requests, "get", fake_get)
+    utils.get_remote_jsonld_context.cache_clear()
+    try:
+        document = {"@context": ["https://example.org/context", {"name": "http://schema.org/name"}]}
+        for _ in range(2):
+            resolved = resolve_jsonld_context(document, fetch_remote=True)
+            assert resolved["@context"][0] == {"@vocab": "http://example.org/"}, "The context should be inlined"
+            assert resolved["@context"][1] == document["@context"][1], "Other contexts should be preserved"
+        assert fetched == ["https://example.org/context"], "The remote context should be fetched only once"
+    finally:
+        utils.get_remote_jsonld_context.cache_clear()
+
+
+def test_several_remote_jsonld_contexts(monkeypatch):
+    fetched = []
+
+    def fake_get(url, **kwargs):
+        fetched.append(url)
+        return FakeContextResponse({"@context": {"@vocab": url}})
+    monkeypatch.setattr(utils.requests, "get", fake_get)
+    utils.get_remote_jsonld_context.cache_clear()
+    try:
+        contexts = ["https://example.org/a", "https://w3id.org/ro/crate/1.1/context", "https://example.org/b"]
+        resolved = resolve_jsonld_context({"@context": contexts}, fetch_remote=True)
+        assert resolved["@context"][0] == {"@vocab": "https://example.org/a"}
+        assert resolved["@context"][1] == utils.get_local_jsonld_context(contexts[1]), \
+            "Well-known contexts should be read from their local copies"
+        assert resolved["@context"][2] == {"@vocab": "https://example.org/b"}
+        assert sorted(fetched) == ["https://example.org/a", "https://example.org/b"], \
+            "Each remote context should be fetched once"
+    finally:
+        utils.get_remote_jsonld_context.cache_clear()
+
+
+def test_external_file_size_requested_once(monkeypatch):
+    requested = []
+
+    def fake_get_external_file_size(uri):
+        requested.append(uri)
+        return 42
+    monkeypatch.setattr(ROCrate, "get_external_file_size", staticmethod(fake_get_external_file_size))
+
+    roc = ROCrateLocalFolder(ValidROC().wrroc_paper)
+    entity = ROCrateEntity(roc.metadata, {"@id": "https://example.org/file.txt", "@type": "File"})
+    assert entity.is_available(), "The external file should be available"
+    assert entity.get_size() == 42, "The size of the external file should be 42"
+    assert ROCrateEntity(roc.metadata, entity.raw_data).is_available(), "The external file should be available"
+    assert requested == ["https://example.org/file.txt"], "The size should be requested only once per crate"
+
+
+def test_metadata_invalid_json_parsed_once(monkeypatch):
+    roc = ROCrateLocalFolder(InvalidFileDescriptor().invalid_json_format)
+
+    with pytest.raises(json.JSONDecodeError):
+        roc.metadata.as_dict()
+
+    # the parsing error is reused by the following calls
+    def fail_loads(*args, **kwargs):
+        raise AssertionError("The file descriptor should not be parsed again")
+    monkeypatch.setattr(json, "loads", fail_loads)
+    with pytest.raises(json.JSONDecodeError):
+        roc.metadata.as_dict()
+
+
 def test_external_file():
     content = ROCrate.get_external_file_content(ValidROC().sort_and_change_remote)
     assert isinstance(content, bytes), "Content should be bytes"